@@ -1,39 +1,31 @@
-import csv
-import random
+import numpy as np
 
 from sklearn.svm import SVC
 from sklearn.linear_model import Perceptron
 from sklearn.naive_bayes import GaussianNB
 from sklearn.neighbors import KNeighborsClassifier
 
-model = Perceptron()
+from loader import load_data
 
-# Read data in from file
-with open("banknotes.csv") as f:
-    reader = csv.reader(f)
-    next(reader)
+model = Perceptron()
 
-    data = []
-    for row in reader:
-        data.append({
-            "evidence": [float(cell) for cell in row[:4]],
-            "label": "Authentic" if row[4] == "0" else "Counterfeit"
-        })
+# Read data in from file (0 = Authentic, 1 = Counterfeit)
+evidence, labels = load_data("banknotes.csv")
 
 # Separate data into training & testing groups 
-holdout = int(0.50 * len(data))  
-random.shuffle(data)
-testing = data[:holdout]
-training = data[:holdout]
+holdout = int(0.50 * len(labels))  
+order = np.random.permutation(len(labels))
+testing = order[:holdout]
+training = order[holdout:]
 
 # Train model on training set
-X_training = [row["evidence"] for row in training]
-Y_training = [row["label"] for row in training]
+X_training = evidence[training]
+Y_training = labels[training]
 model.fit(X_training, Y_training)
 
 # Make prediction on the testing set
-X_testing= [row["evidence"] for row in testing]
-Y_testing = [row["label"] for row in testing]
+X_testing = evidence[testing]
+Y_testing = labels[testing]
 predictions = model.predict(X_testing)
 
 # Compute how well we performed
@@ -1,26 +1,16 @@
-import csv
-import random
-
 from sklearn.svm import SVC
 from sklearn.linear_model import Perceptron
 from sklearn.naive_bayes import GaussianNB
 from sklearn.neighbors import KNeighborsClassifier
 from sklearn.model_selection import train_test_split # 1. Import this
 
+from loader import load_data
+
 model = Perceptron()
 
 # Read data in from file
-with open("banknotes.csv") as f:
-    reader = csv.reader(f)
-    next(reader)
-
-    evidence = []
-    labels = []
-
-    # 2. Separate evidence and labels immediately
-    for row in reader:
-        evidence.append([float(cell) for cell in row[:4]])
-        labels.append("Authentic" if row[4] == "0" else "Counterfeit")
+# 2. Evidence and labels come back as separate arrays (0 = Authentic, 1 = Counterfeit)
+evidence, labels = load_data("banknotes.csv")
 
 # 3. Use train_test_split to shuffle and split the data
 # test_size=0.5 means 50% for testing, 50% for training
@@ -0,0 +1,111 @@
+"""
+Columnar loader for the banknote CSV with an on-disk NumPy cache.
+
+The first load parses the CSV straight into a float32 evidence matrix and
+an int8 label vector, then saves both as .npy files. Later loads memory-map
+those files instead of parsing, as long as the CSV has not changed.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+CACHE_DIR = ".cache"
+
+
+def file_hash(filename, chunk_size=1 << 20):
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_paths(filename, cache_dir=None):
+    """Return the (evidence, labels, metadata) cache paths for a CSV file."""
+    directory = os.path.dirname(os.path.abspath(filename))
+    cache_dir = cache_dir or os.path.join(directory, CACHE_DIR)
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    return (
+        os.path.join(cache_dir, f"{stem}.evidence.npy"),
+        os.path.join(cache_dir, f"{stem}.labels.npy"),
+        os.path.join(cache_dir, f"{stem}.json"),
+    )
+
+
+def parse_csv(filename):
+    """Parse the CSV into (evidence, labels) arrays without a cache."""
+    table = np.loadtxt(filename, delimiter=",", skiprows=1, dtype=np.float32, ndmin=2)
+    evidence = np.ascontiguousarray(table[:, :-1])
+    labels = table[:, -1].astype(np.int8)
+    return evidence, labels
+
+
+def load_data(filename="banknotes.csv", cache=True, cache_dir=None, mmap=True):
+    """
+    Load (evidence, labels) for a banknote-style CSV.
+
+    Evidence is a float32 array of shape (rows, features) and labels an int8
+    array of 0 (authentic) / 1 (counterfeit). The cache is keyed by the
+    file's size and mtime; if those change, the content hash decides whether
+    the cache can still be used.
+    """
+    if not cache:
+        return parse_csv(filename)
+
+    evidence_path, labels_path, meta_path = cache_paths(filename, cache_dir)
+    stat = os.stat(filename)
+
+    meta = None
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+
+    valid = False
+    if meta is not None and os.path.exists(evidence_path) and os.path.exists(labels_path):
+        if meta["size"] == stat.st_size and meta["mtime_ns"] == stat.st_mtime_ns:
+            valid = True
+
+        # File was touched or copied: only reparse if the content changed
+        elif meta["size"] == stat.st_size and meta["sha256"] == file_hash(filename):
+            meta["mtime_ns"] = stat.st_mtime_ns
+            with open(meta_path, "w") as f:
+                json.dump(meta, f)
+            valid = True
+
+    if valid:
+        mode = "r" if mmap else None
+        return np.load(evidence_path, mmap_mode=mode), np.load(labels_path, mmap_mode=mode)
+
+    evidence, labels = parse_csv(filename)
+
+    os.makedirs(os.path.dirname(evidence_path), exist_ok=True)
+    np.save(evidence_path, evidence)
+    np.save(labels_path, labels)
+    with open(meta_path, "w") as f:
+        json.dump({
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": file_hash(filename),
+            "rows": int(evidence.shape[0]),
+            "features": int(evidence.shape[1]),
+        }, f)
+
+    return evidence, labels
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    filename = sys.argv[1] if len(sys.argv) > 1 else "banknotes.csv"
+
+    start = time.perf_counter()
+    evidence, labels = load_data(filename)
+    elapsed = time.perf_counter() - start
+
+    print(f"Loaded {len(labels)} rows x {evidence.shape[1]} features in {elapsed * 1000:.1f} ms")
+    print(f"Counterfeit: {int(labels.sum())}, Authentic: {int(len(labels) - labels.sum())}")
@@ -0,0 +1,263 @@
+"""
+Local prediction server for a trained banknote model.
+
+    python serve.py train --model SVC          # fit once, save model.pkl
+    python serve.py serve --port 8000          # load model.pkl and serve it
+
+Concurrent requests are micro-batched: the first waiting request opens a
+batch, which is closed when it holds `max_batch` rows or `max_wait` seconds
+have passed, and the whole batch is scored with one `predict` call.
+
+    POST /predict  {"evidence": [[3.62, 8.67, -2.81, -0.45], ...]}
+    GET  /stats    latency percentiles and throughput
+"""
+
+import argparse
+import json
+import pickle
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from sklearn.svm import SVC
+from sklearn.linear_model import Perceptron
+from sklearn.naive_bayes import GaussianNB
+from sklearn.neighbors import KNeighborsClassifier
+
+from loader import load_data
+
+MODELS = {
+    "Perceptron": Perceptron,
+    "SVC": SVC,
+    "GaussianNB": GaussianNB,
+    "KNeighborsClassifier": KNeighborsClassifier,
+}
+
+LABELS = ["Authentic", "Counterfeit"]
+
+
+def save_model(model, filename):
+    """Pickle a fitted model to disk."""
+    with open(filename, "wb") as f:
+        pickle.dump(model, f)
+
+
+def load_model(filename):
+    """Load a model saved by save_model. Only load files you trust."""
+    with open(filename, "rb") as f:
+        return pickle.load(f)
+
+
+class MicroBatcher():
+
+    def __init__(self, model, max_batch=64, max_wait=0.002, window=10000):
+        """Score rows for many callers with as few predict calls as possible."""
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.requests = queue.Queue()
+
+        # Rolling statistics: (queued, done, rows) for the last `window`
+        # requests and the sizes of the last `window` batches
+        self.lock = threading.Lock()
+        self.requests_done = deque(maxlen=window)
+        self.batch_sizes = deque(maxlen=window)
+        self.rows = 0
+        self.started = time.perf_counter()
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, evidence):
+        """
+        Queue rows for scoring and return a Future of their predictions.
+        Raises ValueError unless evidence is a list of rows with one finite
+        number per model feature, so bad input never fails a shared batch.
+        """
+        features = self.model.n_features_in_
+        try:
+            rows = np.asarray(evidence, dtype=np.float32)
+        except (TypeError, ValueError):
+            rows = None
+        if rows is None or rows.ndim != 2 or rows.shape[1] != features or not np.isfinite(rows).all():
+            raise ValueError(f"evidence must be a list of rows of {features} numbers")
+
+        future = Future()
+        self.requests.put((rows, future, time.perf_counter()))
+        return future
+
+    def predict(self, evidence):
+        """Score rows and wait for the result."""
+        return self.submit(evidence).result()
+
+    def run(self):
+        """Collect requests into batches and score each batch once."""
+        while True:
+            batch = [self.requests.get()]
+            size = len(batch[0][0])
+            deadline = time.perf_counter() + self.max_wait
+
+            # Keep filling the batch until it is full or the wait expires
+            while size < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                size += len(item[0])
+
+            try:
+                predictions = self.model.predict(np.vstack([rows for rows, _, _ in batch]))
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            # Hand each caller back its own slice of the batch
+            done = time.perf_counter()
+            start = 0
+            for rows, future, queued in batch:
+                future.set_result(predictions[start:start + len(rows)])
+                start += len(rows)
+                with self.lock:
+                    self.requests_done.append((queued, done, len(rows)))
+
+            with self.lock:
+                self.batch_sizes.append(size)
+                self.rows += size
+
+    def stats(self):
+        """
+        Return latency percentiles (ms), mean batch size and throughput over
+        the rolling window, plus lifetime request and row totals.
+        """
+        with self.lock:
+            window = np.array(self.requests_done, dtype=np.float64).reshape(-1, 3)
+            batch_sizes = np.array(self.batch_sizes)
+            rows = self.rows
+        uptime = time.perf_counter() - self.started
+
+        if len(window) == 0:
+            return {"rows": rows, "uptime_s": uptime}
+
+        queued, done, sizes = window.T
+        latencies = done - queued
+        return {
+            "rows": rows,
+            "uptime_s": uptime,
+            "requests": len(window),
+            "p50_ms": float(np.percentile(latencies, 50) * 1000),
+            "p99_ms": float(np.percentile(latencies, 99) * 1000),
+            "mean_batch": float(batch_sizes.mean()),
+            "rows_per_second": float(sizes.sum() / max(done.max() - queued.min(), 1e-9)),
+        }
+
+
+def make_handler(batcher):
+    """Build an HTTP handler class bound to a batcher."""
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def reply(self, status, body):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/stats":
+                self.reply(200, batcher.stats())
+            else:
+                self.reply(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path != "/predict":
+                self.reply(404, {"error": "not found"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length))
+                if not isinstance(body, dict) or "evidence" not in body:
+                    raise ValueError('body must be a JSON object with an "evidence" list')
+                future = batcher.submit(body["evidence"])
+            except ValueError as e:
+                self.reply(400, {"error": str(e)})
+                return
+
+            try:
+                predictions = future.result()
+            except Exception as e:
+                self.reply(500, {"error": f"{type(e).__name__}: {e}"})
+                return
+            self.reply(200, {"predictions": [LABELS[int(p)] for p in predictions]})
+
+        def log_message(self, format, *args):
+            # Keep the hot path quiet; use /stats instead
+            pass
+
+    return Handler
+
+
+class BatchingHTTPServer(ThreadingHTTPServer):
+    # socketserver's default listen backlog of 5 overflows under the
+    # concurrent load micro-batching is for, and clients get resets
+    request_queue_size = 128
+
+
+def serve(model_file="model.pkl", port=8000, max_batch=64, max_wait=0.002, backlog=128):
+    """Serve a saved model on localhost until interrupted."""
+    batcher = MicroBatcher(load_model(model_file), max_batch, max_wait)
+    server = BatchingHTTPServer(("127.0.0.1", port), make_handler(batcher), bind_and_activate=False)
+    server.request_queue_size = backlog
+    try:
+        server.server_bind()
+        server.server_activate()
+    except OSError:
+        server.server_close()
+        raise
+    print(f"Serving {model_file} on http://127.0.0.1:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(batcher.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    train_parser = commands.add_parser("train", help="fit a model and save it")
+    train_parser.add_argument("--data", default="banknotes.csv")
+    train_parser.add_argument("--model", choices=MODELS, default="Perceptron")
+    train_parser.add_argument("--output", default="model.pkl")
+
+    serve_parser = commands.add_parser("serve", help="serve a saved model")
+    serve_parser.add_argument("--model-file", default="model.pkl")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument("--max-batch", type=int, default=64)
+    serve_parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    serve_parser.add_argument("--backlog", type=int, default=128, help="listen queue size")
+
+    args = parser.parse_args()
+
+    if args.command == "train":
+        evidence, labels = load_data(args.data)
+        model = MODELS[args.model]()
+        model.fit(evidence, labels)
+        save_model(model, args.output)
+        print(f"Saved {type(model).__name__} to {args.output}")
+    else:
+        serve(args.model_file, args.port, args.max_batch, args.max_wait_ms / 1000, args.backlog)
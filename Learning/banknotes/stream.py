@@ -0,0 +1,91 @@
+"""
+Out-of-core training for the banknote classifiers.
+
+The CSV is read in fixed-size chunks and fed to `partial_fit`, so only one
+chunk is ever in memory no matter how large the file is. Every
+`holdout_every`-th row is kept out of training and scored in a separate
+evaluation pass.
+"""
+
+import argparse
+from itertools import islice
+
+import numpy as np
+
+from sklearn.linear_model import Perceptron
+from sklearn.naive_bayes import GaussianNB
+
+CLASSES = np.array([0, 1], dtype=np.int8)
+
+MODELS = {
+    "Perceptron": lambda: Perceptron(random_state=0),
+    "GaussianNB": lambda: GaussianNB(),
+}
+
+
+def read_chunks(filename, chunk_size=10000):
+    """Yield (evidence, labels) arrays of at most chunk_size rows."""
+    with open(filename) as f:
+        next(f)
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+            table = np.loadtxt(lines, delimiter=",", dtype=np.float32, ndmin=2)
+            yield table[:, :-1], table[:, -1].astype(np.int8)
+
+
+def split_chunks(filename, chunk_size=10000, holdout_every=5, test=False):
+    """
+    Yield only the training rows (or only the held-out rows if test=True).
+
+    Rows are assigned by their position in the file, so the split is the same
+    on every pass without keeping any index in memory.
+    """
+    offset = 0
+    for evidence, labels in read_chunks(filename, chunk_size):
+        held_out = (np.arange(offset, offset + len(labels)) % holdout_every) == 0
+        offset += len(labels)
+        keep = held_out if test else ~held_out
+        if keep.any():
+            yield evidence[keep], labels[keep]
+
+
+def train(model, filename, chunk_size=10000, holdout_every=5, epochs=1, seed=0):
+    """Train a model incrementally on the training stream."""
+    random = np.random.default_rng(seed)
+    for _ in range(epochs):
+        for evidence, labels in split_chunks(filename, chunk_size, holdout_every):
+            # Shuffle within the chunk; the file itself may be sorted by class
+            order = random.permutation(len(labels))
+            model.partial_fit(evidence[order], labels[order], classes=CLASSES)
+    return model
+
+
+def evaluate(model, filename, chunk_size=10000, holdout_every=5):
+    """Return (correct, total) for the model on the held-out stream."""
+    correct = 0
+    total = 0
+    for evidence, labels in split_chunks(filename, chunk_size, holdout_every, test=True):
+        correct += int((model.predict(evidence) == labels).sum())
+        total += len(labels)
+    return correct, total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("filename", nargs="?", default="banknotes.csv")
+    parser.add_argument("--model", choices=MODELS, default="Perceptron")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--holdout-every", type=int, default=5)
+    parser.add_argument("--epochs", type=int, default=1)
+    args = parser.parse_args()
+
+    model = MODELS[args.model]()
+    train(model, args.filename, args.chunk_size, args.holdout_every, args.epochs)
+    correct, total = evaluate(model, args.filename, args.chunk_size, args.holdout_every)
+
+    print(f"Results for model {type(model).__name__}")
+    print(f"Correct: {correct}")
+    print(f"Incorrect: {total - correct}")
+    print(f"Accuracy: {100 * correct / total:.2f}%")
@@ -1,4 +1,5 @@
 import random
+import time
 
 
 # NIM GAME LOGIC
@@ -83,6 +84,9 @@ class NimAI:
         future = self.best_future_reward(next_state)
         self.update_q_value(state, action, old_q, reward, future)
 
+        # Report how far the estimate moved, so training can tell when it settles
+        return abs(self.get_q_value(state, action) - old_q)
+
     def choose_action(self, state, epsilon=True):
         # Decide what to do next from the current state
         actions = list(Nim.available_actions(state))
@@ -98,13 +102,109 @@ class NimAI:
         return max(actions, key=lambda a: self.get_q_value(state, a))
 
 
+# OPPONENTS USED TO MEASURE PROGRESS
+def random_action(piles, rng=random):
+    # Any legal move, picked uniformly
+    return rng.choice(sorted(Nim.available_actions(piles)))
+
+
+def optimal_action(piles, rng=random):
+    # Perfect play under the rules train() rewards: whoever takes the
+    # last object loses, so we must leave the opponent the last object
+    big = [i for i, pile in enumerate(piles) if pile > 1]
+
+    # Only piles of size 1 left: take one, and hope an odd count remains
+    if not big:
+        return (piles.index(1), 1)
+
+    # Exactly one big pile: shrink it so an odd number of 1-piles remain
+    if len(big) == 1:
+        i = big[0]
+        ones = sum(1 for pile in piles if pile == 1)
+        keep = 1 if ones % 2 == 0 else 0
+        return (i, piles[i] - keep)
+
+    # Otherwise play ordinary Nim: move to a position with nim-sum 0
+    nim_sum = 0
+    for pile in piles:
+        nim_sum ^= pile
+    if nim_sum:
+        for i, pile in enumerate(piles):
+            target = pile ^ nim_sum
+            if target < pile:
+                return (i, pile - target)
+
+    # Losing position: every move loses to perfect play, so pick any
+    return random_action(piles, rng)
+
+
+OPPONENTS = {
+    "random": random_action,
+    "optimal": optimal_action,
+}
+
+
+def evaluate(ai, games=100, opponent="random", seed=0):
+    # Play greedy AI vs an opponent and return the AI's win rate.
+    # The AI alternates between moving first and second.
+    # The opponent gets its own seeded generator, so evaluating never
+    # disturbs training's random stream and every evaluation is comparable
+    opponent = OPPONENTS[opponent]
+    rng = random.Random(seed)
+    wins = 0
+
+    for i in range(games):
+        game = Nim()
+        ai_player = i % 2
+
+        while True:
+            if game.player == ai_player:
+                action = ai.choose_action(game.piles, epsilon=False)
+            else:
+                action = opponent(game.piles, rng)
+
+            mover = game.player
+            game.move(action)
+
+            # Same convention as train(): taking the last object loses
+            if game.winner is not None:
+                if mover != ai_player:
+                    wins += 1
+                break
+
+    return wins / games
+
+
+def greedy_policy(ai):
+    # The move the AI would play in every state it has seen
+    states = {state for state, _ in ai.q}
+    return {state: ai.choose_action(list(state), epsilon=False) for state in states}
+
+
+def policy_change(old, new):
+    # Fraction of states whose greedy move differs (new states count as changed)
+    if not new:
+        return 0.0
+    return sum(1 for state, action in new.items() if old.get(state) != action) / len(new)
+
+
 # TRAIN THE AI BY SELF-PLAY
-def train(n):
+def train(n, log_every=None, opponent="random", eval_games=100,
+          tolerance=None, patience=3, epsilon_decay=1.0, alpha_decay=1.0,
+          min_epsilon=0.0, min_alpha=0.0, log=True):
     # Create a fresh AI agent
     ai = NimAI()
 
+    # Metrics collected every log_every games (also kept on ai.history)
+    ai.history = []
+    window_delta = 0
+    window_updates = 0
+    window_start = time.perf_counter()
+    stable = 0
+    policy = {}
+
     # Let the AI play against itself n times
-    for _ in range(n):
+    for i in range(n):
         game = Nim()
 
         # Track last move of each player so rewards can be assigned properly
@@ -123,14 +223,64 @@ def train(n):
             # If the game ends, assign rewards
             if game.winner is not None:
                 # Losing move gets -1
-                ai.update(state, action, -1, new_state)
+                window_delta += ai.update(state, action, -1, new_state)
 
                 # Winning move gets +1
-                ai.update(*last_move[game.player], 1, new_state)
+                window_delta += ai.update(*last_move[game.player], 1, new_state)
+                window_updates += 2
                 break
             else:
                 # Neutral move – no win or loss yet
-                ai.update(state, action, 0, new_state)
+                window_delta += ai.update(state, action, 0, new_state)
+                window_updates += 1
+
+        # Explore and learn less as the table fills in
+        ai.epsilon = max(min_epsilon, ai.epsilon * epsilon_decay)
+        ai.alpha = max(min_alpha, ai.alpha * alpha_decay)
+
+        # Periodic telemetry
+        if log_every and (i + 1) % log_every == 0:
+            elapsed = time.perf_counter() - window_start
+            new_policy = greedy_policy(ai)
+            metrics = {
+                "games": i + 1,
+                "mean_q_delta": window_delta / max(window_updates, 1),
+                "policy_change": policy_change(policy, new_policy),
+                "win_rate": evaluate(ai, eval_games, opponent),
+                "states": len({state for state, _ in ai.q}),
+                "games_per_second": log_every / elapsed if elapsed else 0.0,
+                "epsilon": ai.epsilon,
+                "alpha": ai.alpha,
+            }
+            ai.history.append(metrics)
+
+            if log:
+                print(
+                    f"Game {metrics['games']}: "
+                    f"delta {metrics['mean_q_delta']:.5f}, "
+                    f"policy change {metrics['policy_change']:.2%}, "
+                    f"win rate vs {opponent} {metrics['win_rate']:.2%}, "
+                    f"states {metrics['states']}, "
+                    f"{metrics['games_per_second']:.0f} games/s"
+                )
+
+            # Stop once the greedy policy has stopped changing for a while.
+            # Q deltas are not used: with alpha decaying they shrink to
+            # nothing whether or not the policy has settled
+            policy = new_policy
+            if tolerance is not None:
+                if metrics["policy_change"] <= tolerance:
+                    stable += 1
+                else:
+                    stable = 0
+                if stable >= patience:
+                    if log:
+                        print(f"Converged after {i + 1} games")
+                    break
+
+            window_delta = 0
+            window_updates = 0
+            window_start = time.perf_counter()
 
     return ai
 
@@ -1,10 +1,22 @@
+import math
 import random
 import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from PIL import Image, ImageDraw
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Space():
 
+    # How many house x cell distances are scored at once; larger grids
+    # are scored a block of rows at a time
+    chunk_limit = 2 ** 22
+
     def __init__(self, height, width, num_hospitals):
         """Create the grid with given size and number of hospitals."""
         self.height = height
@@ -12,6 +24,7 @@ class Space():
         self.num_hospitals = num_hospitals
         self.houses = set()
         self.hospitals = set()
+        self.distance_cache = None
 
     def add_house(self, row, col):
         """Add a house at a specific row and column."""
@@ -48,51 +61,179 @@ class Space():
                 neighbors.append(new_state)
         return neighbors
 
-    def hill_climb(self, maximum=None, image_prefix=None, log=False):
-        """Run hill climbing search to minimize cost."""
+    def nearest_hospitals(self, houses, hospitals):
+        """For each house: (nearest distance, index of nearest hospital, second-nearest distance)."""
+        table = []
+        for row, col in houses:
+            first, index, second = float("inf"), None, float("inf")
+            for i, (r, c) in enumerate(hospitals):
+                distance = abs(row - r) + abs(col - c)
+                if distance < first:
+                    first, index, second = distance, i, first
+                elif distance < second:
+                    second = distance
+            table.append((first, index, second))
+        return table
+
+    def best_move(self, houses, hospitals, table, rng=random):
+        """Return the lowest cost reachable by moving one hospital, and a random move reaching it."""
+        best_cost = None
+        best_moves = []
+
+        for cell in self.available_spaces():
+            r, c = cell
+
+            # Cost if the new cell were added to every hospital, plus the
+            # correction per hospital for houses that lose their nearest one
+            total = 0
+            corrections = [0] * len(hospitals)
+            for (row, col), (first, index, second) in zip(houses, table):
+                distance = abs(row - r) + abs(col - c)
+                keep = distance if distance < first else first
+                total += keep
+                corrections[index] += (distance if distance < second else second) - keep
+
+            for i, correction in enumerate(corrections):
+                cost = total + correction
+                if best_cost is None or cost < best_cost:
+                    best_cost = cost
+                    best_moves = [(i, cell)]
+                elif cost == best_cost:
+                    best_moves.append((i, cell))
+
+        if not best_moves:
+            return None, None
+        return best_cost, rng.choice(best_moves)
+
+    def distance_tables(self):
+        """
+        Return houses as an (n, 2) array with their distances to every row
+        and to every column. A house's distance to cell (r, c) is
+        rows[house, r] + cols[house, c]. Cached until the houses change.
+        """
+        houses = sorted(self.houses)
+        if self.distance_cache is None or self.distance_cache[0] != houses:
+            dtype = np.int16 if self.height + self.width < 2 ** 15 else np.int32
+            array = np.array(houses, dtype=np.int64).reshape(-1, 2)
+            rows = np.abs(array[:, 0, None] - np.arange(self.height)).astype(dtype)
+            cols = np.abs(array[:, 1, None] - np.arange(self.width)).astype(dtype)
+            self.distance_cache = (houses, array, rows, cols)
+        return self.distance_cache[1:]
+
+    def nearest_hospitals_vectorized(self, houses, hospitals):
+        """Like nearest_hospitals, as (first, index, second) arrays."""
+        _, rows, cols = houses
+        hospitals = np.array(hospitals).reshape(-1, 2)
+        distances = rows[:, hospitals[:, 0]] + cols[:, hospitals[:, 1]]
+        order = np.argsort(distances, axis=1, kind="stable")
+        index = order[:, 0]
+        first = np.take_along_axis(distances, order[:, :1], axis=1)[:, 0]
+        if len(hospitals) > 1:
+            second = np.take_along_axis(distances, order[:, 1:2], axis=1)[:, 0]
+        else:
+            # Farther than any cell on the grid
+            second = np.full(len(index), self.height + self.width, dtype=distances.dtype)
+        return first, index, second
+
+    def best_move_vectorized(self, houses, hospitals, table, rng=random):
+        """Like best_move, scoring every (hospital, cell) move with array operations."""
+        array, rows, cols = houses
+        first, index, second = table
+        k = len(hospitals)
+
+        # Sort houses by nearest hospital so each hospital's houses are one slice
+        order = np.argsort(index, kind="stable")
+        bounds = np.searchsorted(index[order], np.arange(k + 1))
+        rows, cols = rows[order], cols[order]
+        first, second = first[order, None, None], second[order, None, None]
+
+        blocked = np.zeros((self.height, self.width), dtype=bool)
+        for row, col in self.houses | set(hospitals):
+            blocked[row, col] = True
+        unreachable = np.iinfo(np.int64).max
+
+        block = max(1, self.chunk_limit // max(1, len(array) * self.width))
+        best_cost = None
+        ties = []
+        for top in range(0, self.height, block):
+            distances = rows[:, top:top + block, None] + cols[:, None, :]
+
+            # Cost with the new cell added to every hospital, plus the
+            # correction per hospital for houses that lose their nearest one
+            keep = np.minimum(distances, first)
+            lost = np.minimum(distances, second)
+            lost -= keep
+            total = keep.sum(axis=0, dtype=np.int64)
+            costs = np.empty((k,) + total.shape, dtype=np.int64)
+            for i in range(k):
+                costs[i] = total + lost[bounds[i]:bounds[i + 1]].sum(axis=0, dtype=np.int64)
+            costs[:, blocked[top:top + block]] = unreachable
+
+            low = costs.min()
+            if low == unreachable:
+                continue
+            if best_cost is None or low < best_cost:
+                best_cost = low
+                ties = []
+            if low == best_cost:
+                moved, row, col = np.nonzero(costs == low)
+                ties.append((moved, row + top, col))
+
+        if best_cost is None:
+            return None, None
+        moved, row, col = (np.concatenate(parts) for parts in zip(*ties))
+        choice = rng.randrange(len(moved))
+        return int(best_cost), (int(moved[choice]), (int(row[choice]), int(col[choice])))
+
+    def hill_climb(self, maximum=None, image_prefix=None, log=False, vectorized=None, rng=random):
+        """
+        Run hill climbing search to minimize cost. Moves are scored with
+        numpy when it is installed, unless vectorized=False. Randomness
+        comes from `rng`, the random module unless a Random is given.
+        """
         count = 0
+        if vectorized is None:
+            vectorized = np is not None
+
+        self.steps = 0
 
         # Initialize hospitals randomly
-        self.hospitals = set(
-            random.sample(
-                list({
-                    (r, c)
-                    for r in range(self.height)
-                    for c in range(self.width)
-                } - self.houses),
-                self.num_hospitals
-            )
-        )
+        self.hospitals = self.random_hospitals(rng)
+
+        # Each move's cost is scored against the nearest / second-nearest
+        # hospital of every house, so neighbor states are never built
+        if vectorized:
+            houses = self.distance_tables()
+            nearest, best_move = self.nearest_hospitals_vectorized, self.best_move_vectorized
+        else:
+            houses = list(self.houses)
+            nearest, best_move = self.nearest_hospitals, self.best_move
+        hospitals = list(self.hospitals)
+        table = nearest(houses, hospitals)
+        current_cost = self.get_cost(self.hospitals)
 
         if log:
-            print(f"Initial cost: {self.get_cost(self.hospitals)}")
+            print(f"Initial cost: {current_cost}")
 
         if image_prefix:
             self.output_image(f"{image_prefix}{str(count).zfill(3)}.png")
 
         while maximum is None or count < maximum:
             count += 1
-            current_cost = self.get_cost(self.hospitals)
-            neighbors = self.get_neighbors()
+            best_cost, move = best_move(houses, hospitals, table, rng)
 
-            if not neighbors:
+            if move is None:
                 break
 
-            best_cost = None
-            best_neighbors = []
-
-            for neighbor in neighbors:
-                cost = self.get_cost(neighbor)
-                if best_cost is None or cost < best_cost:
-                    best_cost = cost
-                    best_neighbors = [neighbor]
-                elif cost == best_cost:
-                    best_neighbors.append(neighbor)
-
             if best_cost >= current_cost:
                 return self.hospitals
 
-            self.hospitals = random.choice(best_neighbors)
+            i, cell = move
+            hospitals[i] = cell
+            self.steps = count
+            self.hospitals = set(hospitals)
+            table = nearest(houses, hospitals)
+            current_cost = best_cost
 
             if log:
                 print(f"Step {count}: cost {best_cost}")
@@ -102,29 +243,287 @@ class Space():
 
         return self.hospitals
 
-    def random_restart(self, restarts, image_prefix=None, log=False):
-        """Run hill climbing multiple times and keep the best result."""
+    def random_restart(self, restarts, image_prefix=None, log=False, workers=1, seed=None, target_cost=None):
+        """
+        Run hill climbing multiple times and keep the best result.
+
+        Restart i gets its own Random seeded from `seed`, and results are
+        applied in restart order, so the outcome is the same for any number
+        of worker processes, with or without `target_cost`. Once a restart
+        reaches `target_cost` no further restarts are started, but those
+        already running in workers finish before this returns. workers=None
+        uses every core. Per-restart statistics are kept in
+        self.restart_stats.
+        """
+        workers = workers or os.cpu_count()
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        rng = random.Random(seed) if seed is not None else random
+        seeds = [rng.getrandbits(64) for _ in range(restarts)]
+        prefixes = [f"{image_prefix}_r{i}_" if image_prefix else None for i in range(restarts)]
+
         best_solution = None
         best_cost = None
+        self.restart_stats = []
 
-        for i in range(restarts):
-            if log:
-                print(f"--- Restart {i + 1} ---")
-            
-            # Run hill climb (state is reset inside hill_climb)
-            solution = self.hill_climb(
-                image_prefix=f"{image_prefix}_r{i}_" if image_prefix else None,
-                log=log
-            )
-            cost = self.get_cost(solution)
-
-            if best_cost is None or cost < best_cost:
-                best_cost = cost
+        def record(solution, stats):
+            nonlocal best_solution, best_cost
+            self.restart_stats.append(stats)
+            if best_cost is None or stats["cost"] < best_cost:
+                best_cost = stats["cost"]
                 best_solution = solution
+            return target_cost is not None and stats["cost"] <= target_cost
+
+        if workers == 1:
+            for i in range(restarts):
+                if record(*climb(self, i, seeds[i], prefixes[i], log)):
+                    break
+        else:
+            # The grid and houses go to each worker once, not with every restart
+            initargs = (self.height, self.width, self.num_hospitals, self.houses)
+            with ProcessPoolExecutor(workers, initializer=init_worker, initargs=initargs) as pool:
+                # Keep a few restarts queued per worker, so few need cancelling
+                running = {}
+                finished = {}
+                submitted = 0
+                applied = 0
+                stop = False
+                while applied < restarts and not stop:
+                    while submitted < restarts and len(running) < 2 * workers:
+                        future = pool.submit(
+                            climb_worker, submitted, seeds[submitted], prefixes[submitted], log
+                        )
+                        running[future] = submitted
+                        submitted += 1
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finished[running.pop(future)] = future.result()
+
+                    while applied in finished and not stop:
+                        stop = record(*finished.pop(applied))
+                        applied += 1
+
+                for future in running:
+                    future.cancel()
 
         self.hospitals = best_solution
         return best_solution
 
+    def random_hospitals(self, rng=random):
+        """Return num_hospitals random cells that are not houses."""
+        return set(
+            rng.sample(
+                list({
+                    (r, c)
+                    for r in range(self.height)
+                    for c in range(self.width)
+                } - self.houses),
+                self.num_hospitals
+            )
+        )
+
+    def random_move(self, hospitals, local=False, rng=random):
+        """
+        Return a random (hospital index, empty cell) move, or None if no cell
+        is empty. Local moves stay within a few cells of the moved hospital.
+        """
+        if len(self.houses) + len(hospitals) >= self.height * self.width:
+            return None
+        taken = set(hospitals)
+
+        if local:
+            i = rng.randrange(len(hospitals))
+            row, col = hospitals[i]
+            radius = max(3, max(self.height, self.width) // 20)
+            for _ in range(100):
+                cell = (row + rng.randint(-radius, radius), col + rng.randint(-radius, radius))
+                if (
+                    0 <= cell[0] < self.height and 0 <= cell[1] < self.width
+                    and cell not in self.houses and cell not in taken
+                ):
+                    return i, cell
+
+        while True:
+            cell = (rng.randrange(self.height), rng.randrange(self.width))
+            if cell not in self.houses and cell not in taken:
+                return rng.randrange(len(hospitals)), cell
+
+    def move_cost(self, houses, table, i, cell):
+        """Total cost after moving hospital i to cell, from the nearest_hospitals table."""
+        r, c = cell
+        cost = 0
+        for (row, col), (first, index, second) in zip(houses, table):
+            distance = abs(row - r) + abs(col - c)
+            keep = second if index == i else first
+            cost += distance if distance < keep else keep
+        return cost
+
+    def nearest_free(self, cell, taken):
+        """Return the empty cell closest to cell, searching outwards in rings."""
+        row, col = cell
+        for radius in range(self.height + self.width):
+            for dr in range(-radius, radius + 1):
+                for dc in {radius - abs(dr), abs(dr) - radius}:
+                    candidate = (row + dr, col + dc)
+                    if (
+                        0 <= candidate[0] < self.height and 0 <= candidate[1] < self.width
+                        and candidate not in self.houses and candidate not in taken
+                    ):
+                        return candidate
+        return None
+
+    def record(self, start, hospitals, cost, log=False):
+        """Keep hospitals if they beat the best so far, noting (seconds, cost) in self.history."""
+        if self.best_cost is None or cost < self.best_cost:
+            self.best_cost = cost
+            self.hospitals = set(hospitals)
+            self.history.append((time.perf_counter() - start, cost))
+            if log:
+                print(f"{self.history[-1][0]:.3f}s: cost {cost}")
+
+    def first_choice(self, time_budget=1.0, patience=1000, local=0.8, log=False, rng=random):
+        """
+        Stochastic hill climbing: take the first random move that lowers the
+        cost, a fraction `local` of moves being local. After `patience`
+        failed tries in a row, restart from a random placement, until
+        time_budget seconds have passed. Returns the best hospitals found;
+        cost over time is kept in self.history.
+        """
+        start = time.perf_counter()
+        houses = list(self.houses)
+        self.history = []
+        self.best_cost = None
+
+        while time.perf_counter() - start < time_budget and self.best_cost != 0:
+            hospitals = list(self.random_hospitals(rng))
+            table = self.nearest_hospitals(houses, hospitals)
+            cost = sum(first for first, _, _ in table)
+            self.record(start, hospitals, cost, log)
+
+            failures = 0
+            while failures < patience and time.perf_counter() - start < time_budget:
+                move = self.random_move(hospitals, rng.random() < local, rng)
+                if move is None:
+                    break
+                new_cost = self.move_cost(houses, table, *move)
+                if new_cost < cost:
+                    i, cell = move
+                    hospitals[i] = cell
+                    table = self.nearest_hospitals(houses, hospitals)
+                    cost = new_cost
+                    failures = 0
+                    self.record(start, hospitals, cost, log)
+                else:
+                    failures += 1
+
+        return self.hospitals
+
+    def initial_temperature(self, houses, hospitals, table, cost, samples=100, rng=random):
+        """Mean cost increase of random moves, so uphill moves start out fairly likely."""
+        increases = []
+        for _ in range(samples):
+            move = self.random_move(hospitals, rng=rng)
+            if move is None:
+                break
+            delta = self.move_cost(houses, table, *move) - cost
+            if delta > 0:
+                increases.append(delta)
+        return sum(increases) / len(increases) if increases else 1.0
+
+    def simulated_annealing(self, time_budget=1.0, temperature=None, cooling="exponential", local=0.8,
+                            log=False, rng=random):
+        """
+        Simulated annealing from a random placement for time_budget seconds.
+        A random move (local with probability `local`) is always taken if it
+        does not raise the cost, and otherwise with probability
+        exp(-increase / T). `cooling` names one of COOLING or is a function
+        (initial temperature, step, fraction of budget used) -> T. Returns
+        the best hospitals found; cost over time is kept in self.history.
+        """
+        start = time.perf_counter()
+        schedule = COOLING[cooling] if isinstance(cooling, str) else cooling
+        houses = list(self.houses)
+        self.history = []
+        self.best_cost = None
+
+        hospitals = list(self.random_hospitals(rng))
+        table = self.nearest_hospitals(houses, hospitals)
+        cost = sum(first for first, _, _ in table)
+        self.record(start, hospitals, cost, log)
+        if temperature is None:
+            temperature = self.initial_temperature(houses, hospitals, table, cost, rng=rng)
+
+        self.steps = 0
+        while self.best_cost != 0:
+            elapsed = time.perf_counter() - start
+            if elapsed >= time_budget:
+                break
+            t = schedule(temperature, self.steps, elapsed / time_budget)
+            self.steps += 1
+
+            move = self.random_move(hospitals, rng.random() < local, rng)
+            if move is None:
+                break
+            increase = self.move_cost(houses, table, *move) - cost
+            if increase <= 0 or (t > 0 and rng.random() < math.exp(-increase / t)):
+                i, cell = move
+                hospitals[i] = cell
+                table = self.nearest_hospitals(houses, hospitals)
+                cost += increase
+                self.record(start, hospitals, cost, log)
+
+        return self.hospitals
+
+    def k_medians(self, time_budget=1.0, log=False, rng=random):
+        """
+        Alternate between assigning houses to their nearest hospital and
+        moving each hospital to the median cell of its houses (the point
+        minimizing total Manhattan distance), or the nearest empty cell to
+        it. Restarts from random placements until time_budget seconds have
+        passed. Returns the best hospitals found; cost over time is kept in
+        self.history.
+        """
+        start = time.perf_counter()
+        houses = list(self.houses)
+        self.history = []
+        self.best_cost = None
+
+        while time.perf_counter() - start < time_budget and self.best_cost != 0:
+            hospitals = list(self.random_hospitals(rng))
+            cost = self.get_cost(hospitals)
+            self.record(start, hospitals, cost, log)
+
+            while time.perf_counter() - start < time_budget:
+                clusters = [[] for _ in hospitals]
+                for house, (_, index, _) in zip(houses, self.nearest_hospitals(houses, hospitals)):
+                    clusters[index].append(house)
+
+                moved = []
+                for hospital, cluster in zip(hospitals, clusters):
+                    target = hospital
+                    if cluster:
+                        rows = sorted(row for row, _ in cluster)
+                        cols = sorted(col for _, col in cluster)
+                        middle = (len(cluster) - 1) // 2
+                        target = (rows[middle], cols[middle])
+                    cell = self.nearest_free(target, moved)
+                    if cell is None:
+                        break
+                    moved.append(cell)
+
+                # Stop if some hospital had no empty cell left to move to
+                if len(moved) < len(hospitals):
+                    break
+                new_cost = self.get_cost(moved)
+                if new_cost >= cost:
+                    break
+                hospitals, cost = moved, new_cost
+                self.record(start, hospitals, cost, log)
+
+        return self.hospitals
+
     def output_image(self, filename):
         """Generate an image of the current state."""
         cell_size = 50
@@ -179,6 +578,61 @@ class Space():
         img.save(filename)
 
 
+def exponential(temperature, step, fraction):
+    """Geometric cooling to a thousandth of the initial temperature over the budget."""
+    return temperature * 0.001 ** fraction
+
+
+def linear(temperature, step, fraction):
+    """Straight down to zero over the budget."""
+    return temperature * (1 - fraction)
+
+
+def logarithmic(temperature, step, fraction):
+    """Classic slow T0 / log(step + 2) schedule."""
+    return temperature / math.log(step + 2)
+
+
+# Cooling schedules for Space.simulated_annealing
+COOLING = {
+    "exponential": exponential,
+    "linear": linear,
+    "logarithmic": logarithmic,
+}
+
+
+def climb(space, restart, seed, image_prefix=None, log=False):
+    """Run one hill climb with its own seeded Random; used by random_restart."""
+    if log:
+        print(f"--- Restart {restart + 1} ---")
+
+    start = time.perf_counter()
+    solution = space.hill_climb(image_prefix=image_prefix, log=log, rng=random.Random(seed))
+    return solution, {
+        "restart": restart,
+        "seed": seed,
+        "cost": space.get_cost(solution),
+        "steps": space.steps,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+# Set once per worker process by init_worker
+_space = None
+
+
+def init_worker(height, width, num_hospitals, houses):
+    """Rebuild the Space in a random_restart worker process."""
+    global _space
+    _space = Space(height, width, num_hospitals)
+    _space.houses = set(houses)
+
+
+def climb_worker(restart, seed, image_prefix=None, log=False):
+    """Worker entry point: one climb on this process's Space."""
+    return climb(_space, restart, seed, image_prefix, log)
+
+
 # -------- Driver Code --------
 
 if __name__ == "__main__":
@@ -198,4 +652,10 @@ if __name__ == "__main__":
     hospitals = s.random_restart(restarts=5, image_prefix="hospitals", log=True)
 
     print("\nFinal hospital locations:", hospitals)
-    print("Final cost:", s.get_cost(hospitals))
\ No newline at end of file
+    print("Final cost:", s.get_cost(hospitals))
+
+    # Alternative optimizers, each with the same time budget
+    for optimizer in (s.first_choice, s.simulated_annealing, s.k_medians):
+        optimizer(time_budget=0.5)
+        seconds, cost = s.history[-1]
+        print(f"{optimizer.__name__}: cost {cost} after {seconds:.3f}s")
\ No newline at end of file
@@ -0,0 +1,263 @@
+"""
+Benchmark the scheduling solvers on graph-coloring instances.
+
+    python benchmark.py generate 100 0.05 --seed 1 -o random100.col
+    python benchmark.py run --random 50:0.1 --col random100.col --colors 3 --timeout 10
+
+Instances are random G(n, p) graphs or DIMACS .col files; every vertex is a
+variable, every edge a "different day" constraint. Each (instance, solver)
+pair runs in its own process with a timeout, and one row per run is written
+as CSV or JSON lines: status, nodes explored, consistency checks, wall time
+and peak resident memory.
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+
+
+def random_instance(n, p, seed=None):
+    """Return (variables, constraints) for a random G(n, p) graph."""
+    rng = random.Random(seed)
+    variables = [str(i + 1) for i in range(n)]
+    constraints = [
+        (variables[i], variables[j])
+        for i in range(n)
+        for j in range(i + 1, n)
+        if rng.random() < p
+    ]
+    return variables, constraints
+
+
+def read_col(filename):
+    """
+    Read a DIMACS .col graph as (variables, constraints). Edges listed more
+    than once, or in both directions, are kept once.
+    """
+    variables = []
+    constraints = []
+    seen = set()
+    with open(filename) as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == "p":
+                variables = [str(i + 1) for i in range(int(parts[2]))]
+            elif parts[0] == "e":
+                edge = tuple(sorted((parts[1], parts[2])))
+                if edge not in seen:
+                    seen.add(edge)
+                    constraints.append((parts[1], parts[2]))
+    return variables, constraints
+
+
+def write_col(filename, variables, constraints, comment=None):
+    """Write (variables, constraints) as a DIMACS .col graph."""
+    number = {variable: i + 1 for i, variable in enumerate(variables)}
+    with open(filename, "w") as f:
+        if comment:
+            f.write(f"c {comment}\n")
+        f.write(f"p edge {len(variables)} {len(constraints)}\n")
+        for x, y in constraints:
+            f.write(f"e {number[x]} {number[y]}\n")
+
+
+# Each solver returns (solution or None, nodes, checks); only local search
+# uses the time budget, complete solvers are stopped by the timeout instead
+
+def run_schedule0(variables, constraints, values, time_budget=None):
+    """Naive backtracking from schedule0.py, counted by wrapping its functions."""
+    import schedule0
+
+    schedule0.VARIABLES = variables
+    schedule0.CONSTRAINTS = constraints
+    schedule0.NEIGHBORS = schedule0.build_neighbors(variables, constraints)
+    schedule0.VALUES = values
+
+    counts = {"nodes": 0, "checks": 0}
+    backtrack = schedule0.backtrack
+    consistent = schedule0.consistent
+
+    def counted_backtrack(assignment):
+        counts["nodes"] += 1
+        return backtrack(assignment)
+
+    def counted_consistent(assignment, var):
+        counts["checks"] += 1
+        return consistent(assignment, var)
+
+    # backtrack() looks both names up globally, so recursion goes through these
+    schedule0.backtrack = counted_backtrack
+    schedule0.consistent = counted_consistent
+    solution = schedule0.backtrack(dict())
+    return solution, counts["nodes"], counts["checks"]
+
+
+def run_schedule1(variables, constraints, values, time_budget=None):
+    """python-constraint, as used in schedule1.py; nodes are not exposed."""
+    from constraint import Problem
+
+    counts = {"checks": 0}
+
+    def different(x, y):
+        counts["checks"] += 1
+        return x != y
+
+    problem = Problem()
+    problem.addVariables(variables, values)
+    for x, y in constraints:
+        problem.addConstraint(different, (x, y))
+    return problem.getSolution(), None, counts["checks"]
+
+
+def run_csp(inference):
+    def run(variables, constraints, values, time_budget=None):
+        """Backtracking with heuristics and inference from csp.py."""
+        from csp import CSP
+
+        solver = CSP(variables, constraints, values, inference)
+        return solver.solve(), solver.nodes, solver.checks
+    return run
+
+
+def run_minconflicts(variables, constraints, values, time_budget=None):
+    """Min-conflicts local search; nodes are search steps."""
+    from minconflicts import MinConflicts
+
+    solver = MinConflicts(variables, constraints, values, seed=0)
+    solution, violations = solver.solve(time_budget or 10.0)
+    return (solution if violations == 0 else None), solver.steps, None
+
+
+SOLVERS = {
+    "schedule0": run_schedule0,
+    "schedule1": run_schedule1,
+    "csp-forward": run_csp("forward"),
+    "csp-mac": run_csp("mac"),
+    "minconflicts": run_minconflicts,
+}
+
+
+def child(solver, variables, constraints, values, time_budget, connection):
+    """Run one solver in this (child) process and send back its measurements."""
+    sys.setrecursionlimit(max(10000, 10 * len(variables)))
+    try:
+        start = time.perf_counter()
+        solution, nodes, checks = SOLVERS[solver](variables, constraints, values, time_budget)
+        seconds = time.perf_counter() - start
+        if solution is not None and any(solution[x] == solution[y] for x, y in constraints):
+            status = "wrong"
+        else:
+            status = "solved" if solution is not None else "unsolved"
+        result = {"status": status, "nodes": nodes, "checks": checks, "seconds": seconds}
+    except Exception as e:
+        result = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+    result["max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    connection.send(result)
+
+
+def run(solver, variables, constraints, values, timeout):
+    """Run one solver in a fresh process, killing it after `timeout` seconds."""
+    receive, send = multiprocessing.Pipe(duplex=False)
+    # Leave local search a little headroom to report its best before the kill
+    process = multiprocessing.Process(
+        target=child, args=(solver, variables, constraints, values, 0.9 * timeout, send)
+    )
+    start = time.perf_counter()
+    process.start()
+    # Only the child holds the sending end now, so its death ends the pipe
+    send.close()
+
+    try:
+        if receive.poll(timeout):
+            result = receive.recv()
+        else:
+            process.terminate()
+            result = {"status": "timeout", "seconds": time.perf_counter() - start}
+    except EOFError:
+        # The child crashed (e.g. a C stack overflow) without reporting back
+        result = {"status": "error", "seconds": time.perf_counter() - start}
+    process.join()
+    receive.close()
+
+    result["exitcode"] = process.exitcode
+    if result["status"] != "timeout" and process.exitcode != 0:
+        result["status"] = "error"
+        result.setdefault("error", f"solver process exited with code {process.exitcode}")
+    return result
+
+
+FIELDS = ["instance", "vertices", "edges", "colors", "solver", "status",
+          "nodes", "checks", "seconds", "max_rss_kb", "exitcode", "error"]
+
+
+def benchmark(instances, solvers, colors=3, timeout=10.0):
+    """Yield one result row per (instance, solver) pair."""
+    values = [f"day{i + 1}" for i in range(colors)]
+    for name, (variables, constraints) in instances:
+        for solver in solvers:
+            row = {
+                "instance": name,
+                "vertices": len(variables),
+                "edges": len(constraints),
+                "colors": colors,
+                "solver": solver,
+            }
+            row.update(run(solver, variables, constraints, values, timeout))
+            yield row
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="write a random G(n, p) .col file")
+    generate.add_argument("n", type=int)
+    generate.add_argument("p", type=float)
+    generate.add_argument("--seed", type=int, default=None)
+    generate.add_argument("-o", "--output", required=True)
+
+    runner = commands.add_parser("run", help="time solvers on instances")
+    runner.add_argument("--random", action="append", default=[], metavar="N:P",
+                        help="random G(n, p) instance (repeatable)")
+    runner.add_argument("--col", action="append", default=[], help="DIMACS .col file (repeatable)")
+    runner.add_argument("--seeds", type=int, default=1, help="random instances per --random")
+    runner.add_argument("--solvers", default=",".join(SOLVERS))
+    runner.add_argument("--colors", type=int, default=3)
+    runner.add_argument("--timeout", type=float, default=10.0)
+    runner.add_argument("--format", choices=["csv", "json"], default="csv")
+    runner.add_argument("-o", "--output", default=None)
+
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        variables, constraints = random_instance(args.n, args.p, args.seed)
+        write_col(args.output, variables, constraints, f"G({args.n}, {args.p}) seed {args.seed}")
+    else:
+        instances = []
+        for spec in args.random:
+            n, p = spec.split(":")
+            for seed in range(args.seeds):
+                instances.append((f"G({n},{p})#{seed}", random_instance(int(n), float(p), seed)))
+        for filename in args.col:
+            instances.append((os.path.basename(filename), read_col(filename)))
+
+        output = open(args.output, "w", newline="") if args.output else sys.stdout
+        writer = csv.DictWriter(output, FIELDS, extrasaction="ignore") if args.format == "csv" else None
+        if writer:
+            writer.writeheader()
+        for row in benchmark(instances, args.solvers.split(","), args.colors, args.timeout):
+            if writer:
+                writer.writerow(row)
+            else:
+                output.write(json.dumps(row) + "\n")
+            output.flush()
+        if args.output:
+            output.close()
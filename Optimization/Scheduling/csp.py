@@ -0,0 +1,157 @@
+"""
+Backtracking search with heuristics and inference.
+
+Variables are chosen by minimum remaining values (ties broken by degree),
+values are tried least-constraining first, and every assignment is followed
+by forward checking and arc consistency (AC-3, i.e. MAC). Takes the same
+VARIABLES / CONSTRAINTS format as schedule0.py: each constraint is a pair
+of variables that must not share a value.
+
+Domains are integer bitmasks (bit i set = VALUES[i] still possible), and a
+neighbor index built once means each check only looks at the constraints
+touching the variable just assigned.
+"""
+
+from collections import deque
+
+VALUES = ["Monday", "Tuesday", "Wednesday"]
+
+
+class CSP():
+
+    def __init__(self, variables, constraints, values=VALUES, inference="mac"):
+        """Set up the problem; inference is "mac", "forward" or None."""
+        self.variables = list(variables)
+        self.values = list(values)
+        self.bit = {value: 1 << i for i, value in enumerate(self.values)}
+        self.inference = inference
+
+        self.neighbors = {variable: set() for variable in self.variables}
+        for x, y in constraints:
+            self.neighbors[x].add(y)
+            self.neighbors[y].add(x)
+
+        # Search statistics
+        self.nodes = 0
+        self.checks = 0
+
+    def revise(self, domains, x, y):
+        """Make x arc-consistent with y; return True if x's domain changed."""
+        self.checks += 1
+
+        # x != y only rules out a value of x when y has one value left
+        only = domains[y]
+        if only & (only - 1) == 0 and domains[x] & only:
+            domains[x] &= ~only
+            return True
+        return False
+
+    def ac3(self, domains, arcs=None):
+        """Enforce arc consistency; return False if a domain becomes empty."""
+        if arcs is None:
+            arcs = [(x, y) for x in self.variables for y in self.neighbors[x]]
+        queue = deque(arcs)
+        while queue:
+            x, y = queue.popleft()
+            if self.revise(domains, x, y):
+                if not domains[x]:
+                    return False
+                for z in self.neighbors[x]:
+                    if z != y:
+                        queue.append((z, x))
+        return True
+
+    def select_unassigned_variable(self, assignment, domains):
+        """Minimum remaining values, then most unassigned neighbors."""
+        return min(
+            (variable for variable in self.variables if variable not in assignment),
+            key=lambda variable: (
+                domains[variable].bit_count(),
+                -sum(1 for n in self.neighbors[variable] if n not in assignment)
+            )
+        )
+
+    def order_domain_values(self, variable, assignment, domains):
+        """Least-constraining value first: rule out the fewest neighbor values."""
+        def ruled_out(value):
+            return sum(
+                1
+                for n in self.neighbors[variable]
+                if n not in assignment and domains[n] & self.bit[value]
+            )
+        values = [value for value in self.values if domains[variable] & self.bit[value]]
+        return sorted(values, key=ruled_out)
+
+    def infer(self, variable, value, assignment, domains):
+        """
+        Return new domains after assigning variable = value, or None if some
+        domain runs out.
+        """
+        bit = self.bit[value]
+        domains = dict(domains)
+        domains[variable] = bit
+
+        # Forward checking: drop the value from unassigned neighbors
+        for n in self.neighbors[variable]:
+            if n not in assignment:
+                self.checks += 1
+                if domains[n] & bit:
+                    domains[n] &= ~bit
+                    if not domains[n]:
+                        return None
+
+        # Maintain arc consistency from the neighbors outwards
+        if self.inference == "mac":
+            arcs = [(n, variable) for n in self.neighbors[variable] if n not in assignment]
+            arcs += [(m, n) for n in self.neighbors[variable] if n not in assignment
+                     for m in self.neighbors[n] if m not in assignment and m != variable]
+            if not self.ac3(domains, arcs):
+                return None
+        return domains
+
+    def backtrack(self, assignment, domains):
+        """Runs backtracking search to find an assignment."""
+        self.nodes += 1
+        if len(assignment) == len(self.variables):
+            return dict(assignment)
+
+        variable = self.select_unassigned_variable(assignment, domains)
+        for value in self.order_domain_values(variable, assignment, domains):
+            if self.inference is None:
+                self.checks += len(self.neighbors[variable])
+                if any(assignment.get(n) == value for n in self.neighbors[variable]):
+                    continue
+                new_domains = domains
+            else:
+                new_domains = self.infer(variable, value, assignment, domains)
+                if new_domains is None:
+                    continue
+
+            assignment[variable] = value
+            result = self.backtrack(assignment, new_domains)
+            if result is not None:
+                return result
+            del assignment[variable]
+        return None
+
+    def solve(self):
+        """Return a complete consistent assignment, or None."""
+        full = (1 << len(self.values)) - 1
+        domains = {variable: full for variable in self.variables}
+        if self.inference == "mac" and not self.ac3(domains):
+            return None
+        return self.backtrack({}, domains)
+
+
+def solve(variables, constraints, values=VALUES, inference="mac"):
+    """Solve a scheduling problem in schedule0.py's format."""
+    return CSP(variables, constraints, values, inference).solve()
+
+
+if __name__ == "__main__":
+    from schedule0 import VARIABLES, CONSTRAINTS
+
+    csp = CSP(VARIABLES, CONSTRAINTS)
+    solution = csp.solve()
+    print(solution)
+    print(f"Nodes: {csp.nodes}, checks: {csp.checks}")
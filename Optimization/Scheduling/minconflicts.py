@@ -0,0 +1,174 @@
+"""
+Min-conflicts local search for large scheduling instances.
+
+Works on the same VARIABLES / CONSTRAINTS model as schedule0.py. For every
+variable it keeps a count of how many neighbors hold each value, updated in
+O(degree) per move, so the conflict count of any (variable, value) pair is
+a table lookup. Recently abandoned values are tabu for a few steps, a small
+fraction of moves are random walks, and the search restarts when it stalls.
+Returns the best assignment found within the time budget.
+"""
+
+import random
+import time
+
+from schedule0 import VALUES
+
+
+class MinConflicts():
+
+    def __init__(self, variables, constraints, values=VALUES, seed=None):
+        """Index the problem by position for fast incremental updates."""
+        self.variables = list(variables)
+        self.values = list(values)
+        self.random = random.Random(seed)
+
+        position = {variable: i for i, variable in enumerate(self.variables)}
+        self.neighbors = [[] for _ in self.variables]
+        for x, y in constraints:
+            self.neighbors[position[x]].append(position[y])
+            self.neighbors[position[y]].append(position[x])
+
+    def reset(self, greedy=True):
+        """Start from a fresh assignment, greedy or uniformly random."""
+        k = len(self.values)
+        self.assignment = [None] * len(self.variables)
+        self.conflicts = [[0] * k for _ in self.variables]
+        self.violations = 0
+
+        order = list(range(len(self.variables)))
+        self.random.shuffle(order)
+        for v in order:
+            if greedy:
+                counts = self.conflicts[v]
+                least = min(counts)
+                value = self.random.choice([x for x in range(k) if counts[x] == least])
+            else:
+                value = self.random.randrange(k)
+            self.assign(v, value)
+
+        # Conflicted variables as a list plus positions: O(1) add, remove and random pick
+        self.conflicted = []
+        self.conflicted_position = {}
+        for v in range(len(self.variables)):
+            self.update_conflicted(v)
+
+    def update_conflicted(self, v):
+        """Add v to or remove it from the conflicted set, as needed."""
+        if self.conflicts[v][self.assignment[v]]:
+            if v not in self.conflicted_position:
+                self.conflicted_position[v] = len(self.conflicted)
+                self.conflicted.append(v)
+        elif v in self.conflicted_position:
+            i = self.conflicted_position.pop(v)
+            last = self.conflicted.pop()
+            if last != v:
+                self.conflicted[i] = last
+                self.conflicted_position[last] = i
+
+    def assign(self, v, value):
+        """Give v a new value, updating neighbor counts and the violation total."""
+        old = self.assignment[v]
+        if old is not None:
+            self.violations -= self.conflicts[v][old]
+        self.violations += self.conflicts[v][value]
+        self.assignment[v] = value
+
+        for n in self.neighbors[v]:
+            counts = self.conflicts[n]
+            if old is not None:
+                counts[old] -= 1
+            counts[value] += 1
+
+    def move(self, v, value):
+        """Assign and keep the set of conflicted variables up to date."""
+        self.assign(v, value)
+        self.update_conflicted(v)
+        for n in self.neighbors[v]:
+            self.update_conflicted(n)
+
+    def solve(self, time_budget=10.0, tabu_tenure=10, walk_probability=0.02, stall_steps=None):
+        """
+        Search until no constraint is violated or the time budget (seconds)
+        runs out, restarting after `stall_steps` steps without improvement.
+
+        Returns (assignment dict, violations) for the best assignment seen.
+        """
+        deadline = time.perf_counter() + time_budget
+        stall_steps = stall_steps or 50 * len(self.variables)
+        k = len(self.values)
+
+        self.steps = 0
+        self.restarts = 0
+        best = None
+        best_violations = None
+
+        while True:
+            self.reset(greedy=self.restarts == 0 or self.random.random() < 0.5)
+            tabu = {}
+            since_improvement = 0
+            run_best = self.violations
+
+            while self.conflicted and since_improvement < stall_steps:
+                # Checking the clock every step is measurable; every 256 is not
+                if self.steps & 255 == 0 and time.perf_counter() > deadline:
+                    break
+                self.steps += 1
+                since_improvement += 1
+
+                v = self.random.choice(self.conflicted)
+                current = self.assignment[v]
+                counts = self.conflicts[v]
+
+                if self.random.random() < walk_probability:
+                    value = self.random.choice([x for x in range(k) if x != current] or [current])
+                else:
+                    # Best non-tabu value; tabu is ignored if it beats the best so far
+                    choices = [
+                        x for x in range(k)
+                        if x != current and (
+                            tabu.get((v, x), 0) <= self.steps
+                            or self.violations - counts[current] + counts[x] < run_best
+                        )
+                    ]
+                    if not choices:
+                        continue
+                    least = min(counts[x] for x in choices)
+                    value = self.random.choice([x for x in choices if counts[x] == least])
+
+                tabu[(v, current)] = self.steps + tabu_tenure
+                self.move(v, value)
+
+                if self.violations < run_best:
+                    run_best = self.violations
+                    since_improvement = 0
+
+                if best_violations is None or self.violations < best_violations:
+                    best_violations = self.violations
+                    best = list(self.assignment)
+
+            if best_violations is None or self.violations < best_violations:
+                best_violations = self.violations
+                best = list(self.assignment)
+
+            if best_violations == 0 or time.perf_counter() > deadline:
+                break
+            self.restarts += 1
+
+        return (
+            {variable: self.values[value] for variable, value in zip(self.variables, best)},
+            best_violations
+        )
+
+
+def min_conflicts(variables, constraints, values=VALUES, time_budget=10.0, seed=None, **options):
+    """Solve a scheduling problem in schedule0.py's format by local search."""
+    return MinConflicts(variables, constraints, values, seed).solve(time_budget, **options)
+
+
+if __name__ == "__main__":
+    from schedule0 import VARIABLES, CONSTRAINTS
+
+    solution, violations = min_conflicts(VARIABLES, CONSTRAINTS, time_budget=1.0, seed=0)
+    print(solution)
+    print(f"Violations: {violations}")
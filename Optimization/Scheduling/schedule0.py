@@ -16,6 +16,19 @@ CONSTRAINTS = [
     ("E", "G"),
     ("F", "G")
 ] 
+VALUES = ["Monday", "Tuesday", "Wednesday"]
+
+
+def build_neighbors(variables, constraints):
+    """Index, once, which variables each variable shares a constraint with."""
+    neighbors = {variable: [] for variable in variables}
+    for (x, y) in constraints:
+        neighbors[x].append(y)
+        neighbors[y].append(x)
+    return neighbors
+
+
+NEIGHBORS = build_neighbors(VARIABLES, CONSTRAINTS)
 
 
 def backtrack(assignment):
@@ -25,15 +38,17 @@ def backtrack(assignment):
     if len(assignment) == len(VARIABLES):
         return assignment
     
-    # Try a new variable
+    # Try a new variable, extending the assignment in place
     var = select_unassigned_variable(assignment)
-    for value in ["Monday","Tuesday","Wednesday"]:
-        new_assignment = assignment.copy()
-        new_assignment[var] = value
-        if consistent(new_assignment):
-            result = backtrack(new_assignment)
+    for value in VALUES:
+        assignment[var] = value
+        if consistent(assignment, var):
+            result = backtrack(assignment)
             if result is not None:
                 return result
+
+        # Undo the assignment instead of copying it at every node
+        del assignment[var]
     return None   
 
 
@@ -45,20 +60,19 @@ def select_unassigned_variable(assignment):
     return None
 
 
-def consistent(assignment):
-    """ Checks to see if an assignment is consistent."""
-    for(x,y) in CONSTRAINTS:
+def consistent(assignment, var):
+    """ Checks to see if assigning var kept the assignment consistent."""
 
-        # Only consider arcs where both are assigned
-        if x not in assignment or y not in assignment:
-            continue
+    # Only the constraints touching var can have been broken
+    for neighbor in NEIGHBORS[var]:
 
         # If both have same value, then not consistent
-        if assignment[x] == assignment[y]:
+        if assignment.get(neighbor) == assignment[var]:
             return False
         
     # If nothing inconsistent, then assignment is consistent
     return True  
 
-solution = backtrack(dict()) 
-print(solution) 
+if __name__ == "__main__":
+    solution = backtrack(dict()) 
+    print(solution) 
@@ -0,0 +1,223 @@
+"""
+Enumerate or count every solution of the scheduling CSP, in parallel.
+
+The days are interchangeable, so any solution can be relabelled into k!
+others. Search only produces the canonical one, where days are introduced
+in order: each variable may use a day already in use, or the first unused
+one. The top of the search tree is split into subproblems that run on a
+pool of worker processes. Solutions stream back in small batches through a
+bounded queue, so memory stays flat however many solutions there are.
+"""
+
+import itertools
+import multiprocessing
+import os
+import queue
+import traceback
+from math import perm
+
+from schedule0 import VALUES
+
+
+class Problem():
+
+    def __init__(self, variables, constraints, values=VALUES):
+        """Fix a static variable order and index earlier neighbors by position."""
+        neighbors = {variable: set() for variable in variables}
+        for x, y in constraints:
+            neighbors[x].add(y)
+            neighbors[y].add(x)
+
+        # Most constrained first; the order itself must stay fixed
+        self.order = sorted(variables, key=lambda v: -len(neighbors[v]))
+        position = {variable: i for i, variable in enumerate(self.order)}
+        self.earlier = [
+            [position[n] for n in neighbors[variable] if position[n] < i]
+            for i, variable in enumerate(self.order)
+        ]
+        self.values = list(values)
+
+    def candidates(self, codes, used):
+        """Values the next variable may take, given codes assigned so far."""
+        i = len(codes)
+        limit = min(used + 1, len(self.values))
+        for value in range(limit):
+            if all(codes[j] != value for j in self.earlier[i]):
+                yield value
+
+    def prefixes(self, depth):
+        """All canonical, consistent assignments of the first `depth` variables."""
+        level = [((), 0)]
+        for _ in range(min(depth, len(self.order))):
+            level = [
+                (codes + (value,), max(used, value + 1))
+                for codes, used in level
+                for value in self.candidates(codes, used)
+            ]
+        return level
+
+    def search(self, codes, used):
+        """Yield every canonical solution extending a prefix, as code tuples."""
+        if len(codes) == len(self.order):
+            yield tuple(codes)
+            return
+
+        # Depth-first with an explicit stack of untried values per level, so
+        # depth is not limited by recursion and codes is extended in place
+        codes = list(codes)
+        start = len(codes)
+        stack = [(iter(list(self.candidates(codes, used))), used)]
+        while stack:
+            values, used = stack[-1]
+            del codes[start + len(stack) - 1:]
+            value = next(values, None)
+            if value is None:
+                stack.pop()
+                continue
+            codes.append(value)
+            if len(codes) == len(self.order):
+                yield tuple(codes)
+                continue
+            used = max(used, value + 1)
+            stack.append((iter(list(self.candidates(codes, used))), used))
+
+    def count(self, codes, used):
+        """Count solutions extending a prefix, as {days used: canonical count}."""
+        counts = {}
+        stack = [(codes, used)]
+        while stack:
+            codes, used = stack.pop()
+            if len(codes) == len(self.order):
+                counts[used] = counts.get(used, 0) + 1
+                continue
+            for value in self.candidates(codes, used):
+                stack.append((codes + (value,), max(used, value + 1)))
+        return counts
+
+    def decode(self, codes):
+        """Turn a code tuple into a {variable: value} dict."""
+        return {variable: self.values[code] for variable, code in zip(self.order, codes)}
+
+
+def split(problem, workers, depth=None):
+    """Pick a split depth giving several subproblems per worker."""
+    if depth is not None:
+        return problem.prefixes(depth)
+    prefixes = problem.prefixes(0)
+    for depth in range(1, len(problem.order) + 1):
+        if len(prefixes) >= 8 * workers:
+            break
+        prefixes = problem.prefixes(depth)
+    return prefixes
+
+
+def count_task(args):
+    """Worker entry point for counting one subproblem."""
+    problem, codes, used = args
+    return problem.count(codes, used)
+
+
+def count(variables, constraints, values=VALUES, workers=None, depth=None, symmetric=True):
+    """
+    Count solutions across a process pool. With symmetric=True (default) the
+    count includes every relabelling of the days; otherwise only canonical
+    solutions are counted.
+    """
+    problem = Problem(variables, constraints, values)
+    workers = workers or os.cpu_count()
+    tasks = [(problem, codes, used) for codes, used in split(problem, workers, depth)]
+
+    total = 0
+    with multiprocessing.Pool(workers) as pool:
+        for counts in pool.imap_unordered(count_task, tasks):
+            for used, n in counts.items():
+                total += n * perm(len(problem.values), used) if symmetric else n
+    return total
+
+
+def stream_worker(problem, tasks, results, batch_size):
+    """
+    Worker entry point: solve subproblems, sending solutions in batches.
+    Always finishes with a None sentinel, preceded by an exception if the
+    worker failed.
+    """
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            batch = []
+            for codes in problem.search(*task):
+                batch.append(codes)
+                if len(batch) >= batch_size:
+                    results.put(batch)
+                    batch = []
+            if batch:
+                results.put(batch)
+    except Exception:
+        results.put(RuntimeError(f"Solution worker failed:\n{traceback.format_exc()}"))
+    finally:
+        results.put(None)
+
+
+def solutions(variables, constraints, values=VALUES, workers=None, depth=None,
+              symmetric=False, batch_size=1000):
+    """
+    Generate solutions as {variable: value} dicts, solved across worker
+    processes. Only canonical solutions are produced unless symmetric=True,
+    in which case each is also yielded under every relabelling of the days.
+    """
+    problem = Problem(variables, constraints, values)
+    workers = workers or os.cpu_count()
+
+    tasks = multiprocessing.Queue()
+    for task in split(problem, workers, depth):
+        tasks.put(task)
+    for _ in range(workers):
+        tasks.put(None)
+
+    # Bounded, so workers wait for a slow consumer instead of piling up results
+    results = multiprocessing.Queue(maxsize=4 * workers)
+    processes = [
+        multiprocessing.Process(target=stream_worker, args=(problem, tasks, results, batch_size), daemon=True)
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        finished = 0
+        while finished < workers:
+            try:
+                batch = results.get(timeout=1.0)
+            except queue.Empty:
+                # A worker killed outright never sends its sentinel
+                if not any(process.is_alive() for process in processes):
+                    raise RuntimeError("Solution workers exited without finishing")
+                continue
+            if batch is None:
+                finished += 1
+                continue
+            if isinstance(batch, Exception):
+                raise batch
+            for codes in batch:
+                if not symmetric:
+                    yield problem.decode(codes)
+                    continue
+                used = max(codes) + 1
+                for labels in itertools.permutations(range(len(problem.values)), used):
+                    yield problem.decode(tuple(labels[code] for code in codes))
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+
+if __name__ == "__main__":
+    from schedule0 import VARIABLES, CONSTRAINTS
+
+    for solution in solutions(VARIABLES, CONSTRAINTS):
+        print(solution)
+    print("Canonical solutions:", count(VARIABLES, CONSTRAINTS, symmetric=False))
+    print("All solutions:", count(VARIABLES, CONSTRAINTS))
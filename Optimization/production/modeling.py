@@ -0,0 +1,281 @@
+"""
+A small modeling layer for linear and mixed-integer production plans.
+
+    model = Model()
+    x1 = model.add_variable("x1")
+    x2 = model.add_variable("x2", integer=True)
+    model.add_constraint(5 * x1 + 2 * x2 <= 20)
+    model.minimize(50 * x1 + 80 * x2)
+    result = model.solve()
+
+Constraints are collected as (row, column, coefficient) triplets and
+assembled straight into scipy.sparse CSR matrices, so large models never
+exist as dense lists. Models with integer variables go to
+scipy.optimize.milp, the rest to linprog. Build and solve times are
+reported separately.
+"""
+
+import numbers
+import time
+
+import numpy as np
+import scipy.optimize
+import scipy.sparse
+
+
+class LinearExpression():
+
+    def __init__(self, terms=None, constant=0.0):
+        """A sum of coefficient * variable terms plus a constant."""
+        self.terms = dict(terms or {})
+        self.constant = constant
+
+    @staticmethod
+    def wrap(other):
+        """Turn a variable or number into an expression."""
+        if isinstance(other, LinearExpression):
+            return other
+        if isinstance(other, Variable):
+            return LinearExpression({other.index: 1.0})
+        return LinearExpression(constant=float(other))
+
+    def __iadd__(self, other):
+        other = LinearExpression.wrap(other)
+        for index, coefficient in other.terms.items():
+            self.terms[index] = self.terms.get(index, 0.0) + coefficient
+        self.constant += other.constant
+        return self
+
+    def __add__(self, other):
+        result = LinearExpression(self.terms, self.constant)
+        result += other
+        return result
+
+    __radd__ = __add__
+
+    def __mul__(self, factor):
+        if not isinstance(factor, numbers.Real):
+            raise TypeError("Expressions can only be multiplied by numbers")
+        return LinearExpression(
+            {index: coefficient * factor for index, coefficient in self.terms.items()},
+            self.constant * factor
+        )
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return self * -1
+
+    def __sub__(self, other):
+        return self + (-LinearExpression.wrap(other))
+
+    def __rsub__(self, other):
+        return LinearExpression.wrap(other) + (-self)
+
+    def __le__(self, other):
+        return Constraint(self - other, "<=")
+
+    def __ge__(self, other):
+        return Constraint(LinearExpression.wrap(other) - self, "<=")
+
+    def __eq__(self, other):
+        return Constraint(self - other, "==")
+
+    __hash__ = None
+
+
+class Variable():
+
+    def __init__(self, index, name, lower=0.0, upper=None, integer=False):
+        """A decision variable; use it in arithmetic to build expressions."""
+        self.index = index
+        self.name = name
+        self.lower = lower
+        self.upper = upper
+        self.integer = integer
+
+    def __repr__(self):
+        return f"Variable({self.name!r})"
+
+    # Arithmetic promotes the variable to an expression
+    def __add__(self, other): return LinearExpression.wrap(self) + other
+    def __radd__(self, other): return LinearExpression.wrap(other) + self
+    def __sub__(self, other): return LinearExpression.wrap(self) - other
+    def __rsub__(self, other): return LinearExpression.wrap(other) - self
+    def __mul__(self, factor): return LinearExpression.wrap(self) * factor
+    def __rmul__(self, factor): return LinearExpression.wrap(self) * factor
+    def __neg__(self): return LinearExpression.wrap(self) * -1
+    def __le__(self, other): return LinearExpression.wrap(self) <= other
+    def __ge__(self, other): return LinearExpression.wrap(self) >= other
+    def __eq__(self, other): return LinearExpression.wrap(self) == other
+
+    __hash__ = object.__hash__
+
+
+class Constraint():
+
+    def __init__(self, expression, sense):
+        """expression (sense) 0, where sense is "<=" or "=="."""
+        self.expression = expression
+        self.sense = sense
+        self.name = None
+
+
+def quicksum(items):
+    """Sum many variables/expressions without copying the running total."""
+    total = LinearExpression()
+    for item in items:
+        total += item
+    return total
+
+
+class Result():
+
+    def __init__(self, status, message, objective, values, timings):
+        """Outcome of Model.solve()."""
+        self.status = status
+        self.message = message
+        self.objective = objective
+        self.values = values
+        self.timings = timings
+
+    @property
+    def success(self):
+        return self.status == 0
+
+    def __getitem__(self, name):
+        return self.values[name]
+
+
+class Model():
+
+    def __init__(self):
+        """An empty model: no variables, no constraints, zero objective."""
+        self.variables = []
+        self.by_name = {}
+        self.constraints = []
+        self.objective = LinearExpression()
+        self.sense = 1
+
+    def add_variable(self, name, lower=0.0, upper=None, integer=False):
+        """Add one variable, non-negative and continuous by default."""
+        if name in self.by_name:
+            raise ValueError(f"Duplicate variable {name!r}")
+        variable = Variable(len(self.variables), name, lower, upper, integer)
+        self.variables.append(variable)
+        self.by_name[name] = variable
+        return variable
+
+    def add_variables(self, names, **options):
+        """Add one variable per name and return them as a list."""
+        return [self.add_variable(name, **options) for name in names]
+
+    def add_constraint(self, constraint, name=None):
+        """Add a constraint built with <=, >= or == on expressions."""
+        if not isinstance(constraint, Constraint):
+            raise TypeError("Expected a constraint such as `x + y <= 10`")
+        constraint.name = name
+        self.constraints.append(constraint)
+        return constraint
+
+    def minimize(self, expression):
+        self.objective = LinearExpression.wrap(expression)
+        self.sense = 1
+
+    def maximize(self, expression):
+        self.objective = LinearExpression.wrap(expression)
+        self.sense = -1
+
+    def build(self):
+        """
+        Assemble the model into arrays: c, A_ub/b_ub and A_eq/b_eq as CSR
+        matrices, bounds and an integrality vector.
+        """
+        n = len(self.variables)
+        c = np.zeros(n)
+        for index, coefficient in self.objective.terms.items():
+            c[index] = self.sense * coefficient
+
+        # (rows, columns, values, right-hand sides) for <= and == separately
+        parts = {"<=": ([], [], [], []), "==": ([], [], [], [])}
+        for constraint in self.constraints:
+            rows, columns, values, rhs = parts[constraint.sense]
+            row = len(rhs)
+            for index, coefficient in constraint.expression.terms.items():
+                rows.append(row)
+                columns.append(index)
+                values.append(coefficient)
+            rhs.append(-constraint.expression.constant)
+
+        matrices = {}
+        for sense, (rows, columns, values, rhs) in parts.items():
+            if rhs:
+                matrices[sense] = (
+                    scipy.sparse.csr_matrix((values, (rows, columns)), shape=(len(rhs), n)),
+                    np.array(rhs)
+                )
+            else:
+                matrices[sense] = (None, None)
+
+        lower = np.array([v.lower if v.lower is not None else -np.inf for v in self.variables])
+        upper = np.array([v.upper if v.upper is not None else np.inf for v in self.variables])
+        integrality = np.array([1 if v.integer else 0 for v in self.variables])
+        return c, matrices["<="], matrices["=="], (lower, upper), integrality
+
+    def solve(self, **options):
+        """Build and solve with linprog, or milp if any variable is integer."""
+        start = time.perf_counter()
+        c, (A_ub, b_ub), (A_eq, b_eq), (lower, upper), integrality = self.build()
+        built = time.perf_counter()
+
+        if integrality.any():
+            constraints = []
+            if A_ub is not None:
+                constraints.append(scipy.optimize.LinearConstraint(A_ub, -np.inf, b_ub))
+            if A_eq is not None:
+                constraints.append(scipy.optimize.LinearConstraint(A_eq, b_eq, b_eq))
+            result = scipy.optimize.milp(
+                c, integrality=integrality, bounds=scipy.optimize.Bounds(lower, upper),
+                constraints=constraints, options=options or None
+            )
+        else:
+            bounds = [
+                (None if np.isinf(l) else l, None if np.isinf(u) else u)
+                for l, u in zip(lower, upper)
+            ]
+            result = scipy.optimize.linprog(
+                c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds,
+                method="highs", options=options or None
+            )
+        solved = time.perf_counter()
+
+        values = {}
+        objective = None
+        if result.x is not None:
+            values = {v.name: float(x) for v, x in zip(self.variables, result.x)}
+            objective = self.sense * float(result.fun) + self.objective.constant
+
+        return Result(result.status, result.message, objective, values, {
+            "build": built - start,
+            "solve": solved - built,
+        })
+
+
+if __name__ == "__main__":
+
+    # Same plan as production.py, but with whole hours on machine 2
+    model = Model()
+    x1 = model.add_variable("x1")
+    x2 = model.add_variable("x2", integer=True)
+
+    model.minimize(50 * x1 + 80 * x2)                 # Cost function: 50x_1 + 80x_2
+    model.add_constraint(5 * x1 + 2 * x2 <= 20)       # constraint 1
+    model.add_constraint(10 * x1 + 12 * x2 >= 90)     # constraint 2
+
+    result = model.solve()
+    if result.success:
+        print(f"X1: {round(result['x1'], 2)} hours")
+        print(f"X2: {round(result['x2'], 2)} hours")
+        print(f"Build: {1000 * result.timings['build']:.2f} ms, solve: {1000 * result.timings['solve']:.2f} ms")
+    else:
+        print("No Solution")
@@ -0,0 +1,158 @@
+"""
+Log-space hidden Markov model inference with NumPy, for batches of sequences.
+
+Sequences of different lengths are padded to a common length and carried
+with a boolean mask. Viterbi and forward-backward then run one time step at
+a time over the whole batch and all states at once.
+"""
+
+import numpy as np
+
+
+def logsumexp(a, axis):
+    """Numerically stable log(sum(exp(a))) along an axis."""
+    peak = np.max(a, axis=axis, keepdims=True)
+    peak = np.where(np.isfinite(peak), peak, 0)
+    with np.errstate(divide="ignore"):
+        return np.log(np.sum(np.exp(a - peak), axis=axis)) + np.squeeze(peak, axis=axis)
+
+
+class HiddenMarkovModel():
+
+    def __init__(self, transitions, emissions, starts, state_names):
+        """
+        Build a model from a transition matrix, one emission dict per state
+        (symbol -> probability) and a start vector, in the same form as
+        HMM/model.py.
+        """
+        self.state_names = list(state_names)
+        self.symbols = []
+        for emission in emissions:
+            for symbol in emission:
+                if symbol not in self.symbols:
+                    self.symbols.append(symbol)
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        self.transitions = np.asarray(transitions, dtype=float)
+        self.starts = np.asarray(starts, dtype=float)
+        self.emissions = np.array([
+            [emission.get(symbol, 0.0) for symbol in self.symbols]
+            for emission in emissions
+        ])
+
+        with np.errstate(divide="ignore"):
+            self.log_transitions = np.log(self.transitions)
+            self.log_starts = np.log(self.starts)
+            self.log_emissions = np.log(self.emissions)
+
+    def encode(self, sequences):
+        """
+        Turn a list of observation sequences into (codes, mask) arrays of
+        shape (batch, longest length), padding shorter sequences with 0.
+        """
+        length = max((len(sequence) for sequence in sequences), default=0)
+        codes = np.zeros((len(sequences), length), dtype=np.intp)
+        mask = np.zeros((len(sequences), length), dtype=bool)
+        for i, sequence in enumerate(sequences):
+            try:
+                codes[i, :len(sequence)] = [self.index[symbol] for symbol in sequence]
+            except KeyError as e:
+                raise ValueError(f"Unknown observation {e.args[0]!r}") from None
+            mask[i, :len(sequence)] = True
+        return codes, mask
+
+    def emission_scores(self, codes):
+        """Log emission probabilities, shape (batch, time, states)."""
+        return self.log_emissions.T[codes]
+
+    def viterbi(self, codes, mask=None):
+        """
+        Return (paths, log_probabilities) for the most likely state sequence of
+        each row. Padded positions in paths are -1.
+        """
+        codes = np.atleast_2d(codes)
+        mask = np.ones(codes.shape, dtype=bool) if mask is None else np.atleast_2d(mask)
+        batch, length = codes.shape
+        states = len(self.state_names)
+        if length == 0:
+            return np.zeros((batch, 0), dtype=np.intp), np.zeros(batch)
+
+        emissions = self.emission_scores(codes)
+        delta = self.log_starts + emissions[:, 0]
+        pointers = np.zeros((batch, length, states), dtype=np.intp)
+        stay = np.broadcast_to(np.arange(states), (batch, states))
+
+        for t in range(1, length):
+            scores = delta[:, :, None] + self.log_transitions
+            best = scores.argmax(axis=1)
+            step = np.take_along_axis(scores, best[:, None, :], axis=1)[:, 0] + emissions[:, t]
+
+            # Padded steps leave the scores alone and point back to themselves
+            valid = mask[:, t, None]
+            delta = np.where(valid, step, delta)
+            pointers[:, t] = np.where(valid, best, stay)
+
+        paths = np.zeros((batch, length), dtype=np.intp)
+        paths[:, -1] = delta.argmax(axis=1)
+        for t in range(length - 1, 0, -1):
+            paths[:, t - 1] = pointers[np.arange(batch), t, paths[:, t]]
+
+        return np.where(mask, paths, -1), delta.max(axis=1)
+
+    def forward_backward(self, codes, mask=None):
+        """
+        Return (posteriors, log_likelihoods): the probability of each state at
+        each step, shape (batch, time, states), and log P(sequence) per row.
+        Padded positions have posteriors of 0.
+        """
+        codes = np.atleast_2d(codes)
+        mask = np.ones(codes.shape, dtype=bool) if mask is None else np.atleast_2d(mask)
+        batch, length = codes.shape
+        states = len(self.state_names)
+        if length == 0:
+            return np.zeros((batch, 0, states)), np.zeros(batch)
+
+        emissions = self.emission_scores(codes)
+        alpha = np.empty((batch, length, states))
+        alpha[:, 0] = self.log_starts + emissions[:, 0]
+        for t in range(1, length):
+            step = logsumexp(alpha[:, t - 1, :, None] + self.log_transitions, axis=1) + emissions[:, t]
+            alpha[:, t] = np.where(mask[:, t, None], step, alpha[:, t - 1])
+
+        beta = np.zeros((batch, length, states))
+        for t in range(length - 2, -1, -1):
+            step = logsumexp(self.log_transitions + (emissions[:, t + 1] + beta[:, t + 1])[:, None, :], axis=2)
+            beta[:, t] = np.where(mask[:, t + 1, None], step, beta[:, t + 1])
+
+        log_likelihoods = logsumexp(alpha[:, -1], axis=1)
+        posteriors = np.exp(alpha + beta - log_likelihoods[:, None, None])
+        return np.where(mask[:, :, None], posteriors, 0.0), log_likelihoods
+
+    def paths(self, codes, mask=None, algorithm="map"):
+        """
+        State index per step for each row, -1 where padded. "map" picks each
+        step's most probable state from forward_backward (pomegranate's
+        default); "viterbi" returns the single most likely state path.
+        """
+        if algorithm == "viterbi":
+            paths, _ = self.viterbi(codes, mask)
+            return paths
+        if algorithm != "map":
+            raise ValueError(f"Unknown algorithm {algorithm!r}, expected 'map' or 'viterbi'")
+        posteriors, _ = self.forward_backward(codes, mask)
+        paths = posteriors.argmax(axis=2)
+        return paths if mask is None else np.where(np.atleast_2d(mask), paths, -1)
+
+    def predict(self, sequence, algorithm="map"):
+        """State indices for one sequence, decoded like pomegranate's predict(algorithm=...)."""
+        codes, mask = self.encode([sequence])
+        return self.paths(codes, mask, algorithm)[0].tolist()
+
+    def decode(self, sequences, algorithm="map"):
+        """State names for each sequence in a list, decoded as in predict."""
+        codes, mask = self.encode(sequences)
+        paths = self.paths(codes, mask, algorithm)
+        return [
+            [self.state_names[state] for state in path[:len(sequence)]]
+            for path, sequence in zip(paths, sequences)
+        ]
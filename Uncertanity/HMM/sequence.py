@@ -1,4 +1,15 @@
-from model import model
+import argparse
+
+# pomegranate is only imported when asked for: python sequence.py --backend pomegranate
+parser = argparse.ArgumentParser()
+parser.add_argument("--backend", choices=["native", "pomegranate"], default="native")
+
+if parser.parse_args().backend == "pomegranate":
+    from model import model
+    names = [state.name for state in model.states]
+else:
+    from weather import model
+    names = model.state_names
 
 #Observed data
 observations = [
@@ -12,7 +23,7 @@ observations = [
     "no umbrella",
 ]
 
-#predict underlying states
-predictions = model.predict(observations)
+#predict underlying states; both backends decode each step from the posterior
+predictions = model.predict(observations, algorithm="map")
 for prediction in predictions:
-    print(model.states[prediction].name)  
\ No newline at end of file
+    print(names[prediction])  
\ No newline at end of file
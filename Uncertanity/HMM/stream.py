@@ -0,0 +1,114 @@
+"""
+Constant-memory filtering and fixed-lag smoothing for an unbounded stream.
+
+    from weather import model
+    f = StreamingFilter(model, lag=3)
+    f.push("umbrella")     # -> belief over states right now
+
+Only the last `lag + 1` forward messages and emissions are kept, so memory
+is O(states x lag) no matter how long the stream runs.
+"""
+
+from collections import deque
+
+import numpy as np
+
+
+class StreamingFilter():
+
+    def __init__(self, model, lag=0, renormalize_every=1):
+        """Track the belief state of an hmm.HiddenMarkovModel one observation at a time."""
+        self.model = model
+        self.lag = lag
+        self.renormalize_every = renormalize_every
+        self.reset()
+
+    def reset(self):
+        """Forget everything seen so far."""
+        self.forward = None
+        self.steps = 0
+        self.log_scale = 0.0
+        self.window = deque(maxlen=self.lag + 1)
+
+    def normalize(self):
+        """Rescale the forward message to sum to 1, folding the scale into log_scale."""
+        total = self.forward.sum()
+        if total <= 0:
+            raise ValueError("Observation has zero probability under the model")
+        self.log_scale += np.log(total)
+        self.forward = self.forward / total
+
+    def push(self, observation):
+        """Add one observation and return the current belief over states."""
+        try:
+            emission = self.model.emissions[:, self.model.index[observation]]
+        except KeyError:
+            raise ValueError(f"Unknown observation {observation!r}") from None
+
+        if self.forward is None:
+            self.forward = self.model.starts * emission
+        else:
+            self.forward = (self.forward @ self.model.transitions) * emission
+        self.steps += 1
+
+        # Scale down periodically so long streams don't underflow
+        if self.steps % self.renormalize_every == 0:
+            self.normalize()
+
+        self.window.append((self.forward / self.forward.sum(), emission))
+        return self.belief
+
+    @property
+    def log_likelihood(self):
+        """log P(everything so far): the folded scales plus the mass since the last rescale."""
+        if self.forward is None:
+            return 0.0
+        return self.log_scale + float(np.log(self.forward.sum()))
+
+    @property
+    def belief(self):
+        """Filtered P(state now | everything so far)."""
+        if self.forward is None:
+            return self.model.starts.copy()
+        return self.forward / self.forward.sum()
+
+    def smoothed(self):
+        """
+        Return (step, belief) for the step `lag` observations back, smoothed
+        with everything seen since. Until enough observations have arrived,
+        the oldest step in the window is used.
+        """
+        if not self.window:
+            return None
+        backward = np.ones(len(self.model.state_names))
+        for _, emission in reversed(list(self.window)[1:]):
+            backward = self.model.transitions @ (emission * backward)
+            backward = backward / backward.sum()
+        forward, _ = self.window[0]
+        belief = forward * backward
+        return self.steps - len(self.window) + 1, belief / belief.sum()
+
+
+if __name__ == "__main__":
+    from weather import model
+
+    #Observed data
+    observations = [
+        "umbrella",
+        "umbrella",
+        "no umbrella",
+        "umbrella",
+        "umbrella",
+        "umbrella",
+        "no umbrella",
+        "no umbrella",
+    ]
+
+    f = StreamingFilter(model, lag=2)
+    for observation in observations:
+        belief = f.push(observation)
+        step, smoothed = f.smoothed()
+        print(
+            f"{observation:<12} now: {model.state_names[belief.argmax()]:<4} "
+            f"(step {step}: {model.state_names[smoothed.argmax()]})"
+        )
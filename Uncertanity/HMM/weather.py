@@ -0,0 +1,33 @@
+import numpy
+
+from hmm import HiddenMarkovModel
+
+# Same model as model.py, without pomegranate
+
+#observation model for each state
+sun = {
+    "umbrella": 0.2,
+    "no umbrella": 0.8
+}
+
+rain = {
+    "umbrella": 0.9,
+    "no umbrella": 0.1
+}
+
+states = [sun, rain]
+
+#Transition model
+transitions = numpy.array(
+    [[0.8, 0.2], #Tommorow's prediction if today = sun
+     [0.3, 0.7]] #Tommorow's prediction if today = rain
+)
+
+#Starting probabilities
+starts = numpy.array([0.5, 0.5])
+
+#create the model
+model = HiddenMarkovModel(
+    transitions, states, starts,
+    state_names=["sun", "rain"]
+)
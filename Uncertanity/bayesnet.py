@@ -0,0 +1,343 @@
+"""
+Exact inference for discrete Bayesian networks, using NumPy only.
+
+Each conditional probability table is stored as a NumPy factor whose axes
+are (parents..., node). Queries run variable elimination with a min-fill
+elimination order, after dropping nodes that cannot affect the answer.
+"""
+
+import json
+import os
+import pickle
+
+import numpy as np
+
+# Bump when the pickled layout of BayesianNetwork changes
+CACHE_FORMAT = 1
+
+
+class Factor():
+
+    def __init__(self, variables, table):
+        """A table over the given variables, one axis per variable."""
+        self.variables = tuple(variables)
+        self.table = table
+
+    def reduce(self, evidence):
+        """Fix observed variables (name -> value index) and drop their axes."""
+        if not any(variable in evidence for variable in self.variables):
+            return self
+        index = tuple(
+            evidence[variable] if variable in evidence else slice(None)
+            for variable in self.variables
+        )
+        variables = [variable for variable in self.variables if variable not in evidence]
+        return Factor(variables, self.table[index])
+
+    def multiply(self, other):
+        """Return the product of two factors over the union of their variables."""
+        variables = list(self.variables)
+        for variable in other.variables:
+            if variable not in variables:
+                variables.append(variable)
+        axes = {variable: i for i, variable in enumerate(variables)}
+        table = np.einsum(
+            self.table, [axes[v] for v in self.variables],
+            other.table, [axes[v] for v in other.variables],
+            list(range(len(variables)))
+        )
+        return Factor(variables, table)
+
+    def sum_out(self, variable):
+        """Marginalize a variable out of the factor."""
+        axis = self.variables.index(variable)
+        variables = self.variables[:axis] + self.variables[axis + 1:]
+        return Factor(variables, self.table.sum(axis=axis))
+
+
+def product(factors):
+    """Multiply a list of factors together."""
+    result = factors[0]
+    for factor in factors[1:]:
+        result = result.multiply(factor)
+    return result
+
+
+def min_fill_order(factors, variables):
+    """
+    Greedy elimination order for the given variables.
+
+    At each step picks the variable whose elimination adds the fewest new
+    edges to the interaction graph, breaking ties by fewest neighbors.
+    """
+    neighbors = {}
+    for factor in factors:
+        for variable in factor.variables:
+            neighbors.setdefault(variable, set()).update(factor.variables)
+    for variable in neighbors:
+        neighbors[variable].discard(variable)
+
+    remaining = set(variables)
+    order = []
+    while remaining:
+        def fill(variable):
+            adjacent = list(neighbors.get(variable, ()))
+            missing = sum(
+                1
+                for i, a in enumerate(adjacent)
+                for b in adjacent[i + 1:]
+                if b not in neighbors[a]
+            )
+            return (missing, len(adjacent), variable)
+
+        variable = min(remaining, key=fill)
+        order.append(variable)
+        remaining.remove(variable)
+
+        # Connect its neighbors to each other, then remove it
+        adjacent = neighbors.pop(variable, set())
+        for a in adjacent:
+            neighbors[a].discard(variable)
+            neighbors[a].update(adjacent - {a})
+
+    return order
+
+
+def eliminate(factors, order):
+    """Sum out variables in the given order and return the remaining factors."""
+    factors = list(factors)
+    for variable in order:
+        involved = [factor for factor in factors if variable in factor.variables]
+        if not involved:
+            continue
+        factors = [factor for factor in factors if variable not in factor.variables]
+        factors.append(product(involved).sum_out(variable))
+    return factors
+
+
+class Node():
+
+    def __init__(self, name, values, parents, table):
+        """A variable, its possible values, its parents and its CPT."""
+        self.name = name
+        self.values = values
+        self.parents = parents
+        self.table = table
+        self.index = {value: i for i, value in enumerate(values)}
+
+
+class BayesianNetwork():
+
+    def __init__(self):
+        """Create an empty network. Nodes must be added parents first."""
+        self.nodes = {}
+        self.log_tables = None
+
+    def add_node(self, name, distribution, parents=()):
+        """
+        Add a node from either a dict of value -> probability (no parents) or
+        a list of rows [parent values..., value, probability], as used by
+        pomegranate's DiscreteDistribution and ConditionalProbabilityTable.
+        """
+        if name in self.nodes:
+            raise ValueError(f"Duplicate node {name!r}")
+        for parent in parents:
+            if parent not in self.nodes:
+                raise ValueError(f"Parent {parent!r} of node {name!r} must be added first")
+        parents = [self.nodes[parent] for parent in parents]
+
+        if isinstance(distribution, dict):
+            if parents:
+                raise ValueError(f"Node {name!r} has parents but no conditional table")
+            values = list(distribution)
+            table = np.array([distribution[value] for value in values], dtype=float)
+        else:
+            values = []
+            for row in distribution:
+                if len(row) != len(parents) + 2:
+                    raise ValueError(f"Bad row {row!r} for node {name!r}")
+                if row[-2] not in values:
+                    values.append(row[-2])
+            table = np.zeros([len(parent.values) for parent in parents] + [len(values)])
+            for row in distribution:
+                try:
+                    index = tuple(parent.index[value] for parent, value in zip(parents, row[:-2]))
+                except KeyError as e:
+                    raise ValueError(f"Unknown parent value {e.args[0]!r} in row {row!r}") from None
+                table[index + (values.index(row[-2]),)] = row[-1]
+
+        if not np.allclose(table.sum(axis=-1), 1):
+            raise ValueError(f"Probabilities for node {name!r} do not sum to 1")
+
+        self.nodes[name] = Node(name, values, [parent.name for parent in parents], table)
+        self.log_tables = None
+        return self.nodes[name]
+
+    def to_dict(self):
+        """Return the network as plain data, in the format add_node accepts."""
+        nodes = []
+        for name, node in self.nodes.items():
+            if not node.parents:
+                nodes.append({"name": name, "distribution": dict(zip(node.values, node.table.tolist()))})
+                continue
+            rows = []
+            for index in np.ndindex(*node.table.shape):
+                parent_values = [self.nodes[p].values[i] for p, i in zip(node.parents, index)]
+                rows.append(parent_values + [node.values[index[-1]], float(node.table[index])])
+            nodes.append({"name": name, "parents": node.parents, "distribution": rows})
+        return {"nodes": nodes}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build and validate a network from the data to_dict returns."""
+        network = cls()
+        for node in data["nodes"]:
+            network.add_node(node["name"], node["distribution"], node.get("parents", ()))
+        return network
+
+    def save(self, filename):
+        """Write the network to a JSON model file."""
+        with open(filename, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def factor(self, name):
+        """Return a node's CPT as a factor over (parents..., node)."""
+        node = self.nodes[name]
+        return Factor(node.parents + [name], node.table)
+
+    def encode_evidence(self, evidence):
+        """Turn {name: value} evidence into {name: value index}."""
+        codes = {}
+        for name, value in evidence.items():
+            if name not in self.nodes:
+                raise ValueError(f"Unknown node {name!r}")
+            if value not in self.nodes[name].index:
+                raise ValueError(f"Unknown value {value!r} for node {name!r}")
+            codes[name] = self.nodes[name].index[value]
+        return codes
+
+    def encode(self, rows):
+        """
+        Turn rows of values (one column per node, in node order) into a 2-D
+        array of value codes, using each node's value -> code table.
+        """
+        indexes = [node.index for node in self.nodes.values()]
+        columns = list(zip(*rows)) if len(rows) else [()] * len(indexes)
+        if len(columns) != len(indexes):
+            raise ValueError(f"Expected rows of {len(indexes)} values")
+
+        codes = np.empty((len(rows), len(indexes)), dtype=np.intp)
+        for i, (index, column) in enumerate(zip(indexes, columns)):
+            try:
+                codes[:, i] = np.fromiter(map(index.__getitem__, column), dtype=np.intp, count=len(column))
+            except KeyError as e:
+                name = list(self.nodes)[i]
+                raise ValueError(f"Unknown value {e.args[0]!r} for node {name!r}") from None
+        return codes
+
+    def log_probability(self, codes):
+        """
+        Return the joint log-probability of every row of a 2-D code array
+        (as built by encode), gathering from each log-CPT in one pass.
+        """
+        if self.log_tables is None:
+            with np.errstate(divide="ignore"):
+                self.log_tables = [np.log(node.table) for node in self.nodes.values()]
+
+        codes = np.asarray(codes)
+        column = {name: i for i, name in enumerate(self.nodes)}
+        total = np.zeros(len(codes))
+        for node, table in zip(self.nodes.values(), self.log_tables):
+            index = tuple(codes[:, column[name]] for name in node.parents + [node.name])
+            total += table[index]
+        return total
+
+    def probability(self, rows):
+        """Return the joint probability of each row of values."""
+        return np.exp(self.log_probability(self.encode(rows)))
+
+    def ancestors(self, names):
+        """Return the given nodes together with all of their ancestors."""
+        result = set()
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name not in result:
+                result.add(name)
+                stack.extend(self.nodes[name].parents)
+        return result
+
+    def query(self, name, evidence, order=None):
+        """
+        Return the posterior over one node's values as an array, given
+        evidence already encoded as {name: value index}.
+
+        Pass `order` to override the min-fill elimination order.
+        """
+        # Nodes that are not ancestors of the query or evidence sum to 1
+        relevant = self.ancestors([name, *evidence])
+        factors = [self.factor(node).reduce(evidence) for node in self.nodes if node in relevant]
+
+        hidden = [node for node in relevant if node != name and node not in evidence]
+        if order is None:
+            order = min_fill_order(factors, hidden)
+        else:
+            order = [node for node in order if node in hidden]
+            order += [node for node in hidden if node not in order]
+
+        table = product(eliminate(factors, order)).table
+        return table / table.sum()
+
+    def predict_proba(self, evidence=None, order=None):
+        """
+        Return posteriors for every node given evidence like {"train": "delayed"}.
+
+        Observed nodes map to their observed value; every other node maps to a
+        dict of value -> probability.
+        """
+        evidence = evidence or {}
+        codes = self.encode_evidence(evidence)
+
+        predictions = {}
+        for name, node in self.nodes.items():
+            if name in evidence:
+                predictions[name] = evidence[name]
+            else:
+                posterior = self.query(name, codes, order)
+                predictions[name] = dict(zip(node.values, posterior.tolist()))
+        return predictions
+
+
+def load(filename, cache=True):
+    """
+    Load a network from a JSON model file.
+
+    The validated network is pickled under .cache/ next to the file, and that
+    compiled copy is reused for as long as the file's size and mtime match
+    and this module is unchanged. Unreadable caches are rebuilt from JSON.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    cache_path = os.path.join(directory, ".cache", f"{stem}.pickle")
+    stat = os.stat(filename)
+    # A pickled network is only valid for the class layout that wrote it
+    code = os.stat(__file__)
+    key = (CACHE_FORMAT, stat.st_size, stat.st_mtime_ns, code.st_size, code.st_mtime_ns)
+
+    if cache and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, network = pickle.load(f)
+            if cached_key == key:
+                return network
+        except Exception:
+            pass
+
+    with open(filename) as f:
+        network = BayesianNetwork.from_dict(json.load(f))
+
+    if cache:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump((key, network), f)
+    return network
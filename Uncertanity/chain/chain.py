@@ -0,0 +1,109 @@
+"""
+Fast Markov chain sampling and distribution queries with NumPy.
+
+Each transition row is turned into an alias table once, so every step is two
+uniform draws and a lookup. Samples come back as arrays of state codes,
+either for one long chain or for many chains stepped together. n-step and
+stationary distributions are computed directly from the transition matrix,
+without simulating.
+"""
+
+import numpy as np
+
+
+def alias_table(probabilities):
+    """Build Walker alias (prob, alias) arrays for one discrete distribution."""
+    n = len(probabilities)
+    scaled = np.asarray(probabilities, dtype=float) * n
+    prob = np.ones(n)
+    alias = np.arange(n)
+
+    small = [i for i in range(n) if scaled[i] < 1]
+    large = [i for i in range(n) if scaled[i] >= 1]
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] -= 1 - scaled[s]
+        (small if scaled[l] < 1 else large).append(l)
+    return prob, alias
+
+
+class MarkovChain():
+
+    def __init__(self, start, transition):
+        """
+        Build a chain from a start dict (state -> probability) and transition
+        rows [from, to, probability], as in chain/model.py.
+        """
+        self.states = list(start)
+        self.index = {state: i for i, state in enumerate(self.states)}
+        self.start = np.array([start[state] for state in self.states], dtype=float)
+
+        self.transitions = np.zeros((len(self.states), len(self.states)))
+        for a, b, p in transition:
+            self.transitions[self.index[a], self.index[b]] = p
+        if not np.allclose(self.transitions.sum(axis=1), 1):
+            raise ValueError("Transition rows do not sum to 1")
+
+        tables = [alias_table(row) for row in self.transitions]
+        self.prob = np.array([prob for prob, _ in tables])
+        self.alias = np.array([alias for _, alias in tables])
+        self.start_prob, self.start_alias = alias_table(self.start)
+
+    def sample(self, n, chains=1, rng=None):
+        """
+        Return state codes of shape (chains, n). A single chain is stepped in
+        a tight loop over pre-drawn uniforms; many chains step together.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        k = len(self.states)
+        codes = np.empty((chains, n), dtype=np.intp)
+        if n == 0:
+            return codes
+
+        columns = rng.integers(k, size=(chains, n))
+        uniforms = rng.random((chains, n))
+
+        first = columns[:, 0]
+        codes[:, 0] = np.where(uniforms[:, 0] < self.start_prob[first], first, self.start_alias[first])
+
+        if chains == 1:
+            prob = self.prob.tolist()
+            alias = self.alias.tolist()
+            out = [int(codes[0, 0])]
+            state = out[0]
+            for j, u in zip(columns[0, 1:].tolist(), uniforms[0, 1:].tolist()):
+                state = j if u < prob[state][j] else alias[state][j]
+                out.append(state)
+            codes[0] = out
+        else:
+            for t in range(1, n):
+                state = codes[:, t - 1]
+                j = columns[:, t]
+                codes[:, t] = np.where(uniforms[:, t] < self.prob[state, j], j, self.alias[state, j])
+        return codes
+
+    def names(self, codes):
+        """Turn an array of state codes into state names."""
+        return np.array(self.states, dtype=object)[codes].tolist()
+
+    def n_step(self, n, start=None):
+        """
+        Distribution over states after n steps, from `start` (a probability
+        vector, or a state name) or the chain's start distribution.
+        """
+        if start is None:
+            start = self.start
+        elif isinstance(start, str):
+            start = np.eye(len(self.states))[self.index[start]]
+
+        # matrix_power multiplies by repeated squaring: O(log n) products
+        return np.asarray(start, dtype=float) @ np.linalg.matrix_power(self.transitions, n)
+
+    def stationary(self):
+        """Stationary distribution: the left eigenvector for eigenvalue 1."""
+        values, vectors = np.linalg.eig(self.transitions.T)
+        vector = np.real(vectors[:, np.argmin(np.abs(values - 1))])
+        return vector / vector.sum()
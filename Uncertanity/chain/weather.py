@@ -0,0 +1,29 @@
+from chain import MarkovChain
+
+# Same chain as model.py, without pomegranate
+
+#Define starting probabilities 
+start = {
+    "sun": 0.5,
+    "rain": 0.5
+}
+
+#Define transition model
+transition = [
+    ["sun", "sun", 0.8],
+    ["sun", "rain", 0.2],
+    ["rain", "sun", 0.3],
+    ["rain", "rain", 0.7]
+]
+
+#create Markov chain
+model = MarkovChain(start, transition)
+
+if __name__ == "__main__":
+
+    #sample 50 states from chain
+    print(model.names(model.sample(50)[0]))
+
+    #where the chain ends up, without simulating
+    print("After 10 days:", dict(zip(model.states, model.n_step(10, "rain").tolist())))
+    print("Stationary:", dict(zip(model.states, model.stationary().tolist())))
@@ -1,15 +1,64 @@
-from model import model
-
-#Calculate predictions
-predictions = model.predict_proba({
-    "train": "delayed"
-})
-
-#Print predictions for each node
-for node, prediction in zip(model.states, predictions):
-    if isinstance(prediction, str):
-        print(f"{node.name}: {prediction}")
-    else:
-        print(f"{node.name}:")
-        for value, probability in prediction.parameters[0].items():
-            print(f"  {value}: {probability:.4f}")     
\ No newline at end of file
+"""
+Usage: python inference.py [node=value ...] [--backend {native,pomegranate}]
+
+Defaults to the evidence train=delayed. The native backend reads
+network.json; pomegranate is only imported when asked for.
+"""
+
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("evidence", nargs="*", metavar="node=value")
+parser.add_argument("--backend", choices=["native", "pomegranate"], default="native")
+args = parser.parse_args()
+
+backend = args.backend
+evidence = {}
+for arg in args.evidence:
+    node, sep, value = arg.partition("=")
+    if not sep or not node or not value:
+        parser.error(f"evidence must look like node=value, got {arg!r}")
+    evidence[node] = value
+evidence = evidence or {"train": "delayed"}
+
+if backend == "pomegranate":
+    from model import model
+
+    names = [state.name for state in model.states]
+    for node in evidence:
+        if node not in names:
+            parser.error(f"Unknown node {node!r}")
+
+    #Calculate predictions
+    try:
+        predictions = model.predict_proba(evidence)
+    except (KeyError, ValueError) as e:
+        parser.error(f"Invalid evidence: {e}")
+
+    #Print predictions for each node
+    for node, prediction in zip(model.states, predictions):
+        if isinstance(prediction, str):
+            print(f"{node.name}: {prediction}")
+        else:
+            print(f"{node.name}:")
+            for value, probability in prediction.parameters[0].items():
+                print(f"  {value}: {probability:.4f}")
+else:
+    from network import model
+
+    try:
+        model.encode_evidence(evidence)
+    except ValueError as e:
+        parser.error(str(e))
+
+    #Calculate predictions
+    predictions = model.predict_proba(evidence)
+
+    #Print predictions for each node
+    for node, prediction in predictions.items():
+        if isinstance(prediction, str):
+            print(f"{node}: {prediction}")
+        else:
+            print(f"{node}:")
+            for value, probability in prediction.items():
+                print(f"  {value}: {probability:.4f}")
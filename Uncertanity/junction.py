@@ -0,0 +1,219 @@
+"""
+Junction-tree inference for repeated queries against one Bayesian network.
+
+The network is compiled once into a tree of cliques. Messages between
+cliques are cached, and changing the evidence on a variable only discards
+the messages flowing away from the clique that holds that evidence, so the
+next query recomputes just those. Whole answers are also kept in an LRU
+cache keyed by the evidence set.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from bayesnet import Factor, min_fill_order, product
+
+
+class JunctionTree():
+
+    def __init__(self, network, cache_size=1024):
+        """Compile a BayesianNetwork into a junction tree."""
+        self.network = network
+        self.cliques = []
+        self.neighbors = []
+        self.potentials = []
+        self.home = {}
+        self.messages = {}
+        self.evidence = {}
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.compile()
+
+    def compile(self):
+        """Triangulate the moral graph and build the clique tree."""
+        network = self.network
+        factors = [network.factor(name) for name in network.nodes]
+
+        # Eliminating in min-fill order triangulates the moral graph; each
+        # variable together with its neighbors at that point forms a clique
+        neighbors = {name: set() for name in network.nodes}
+        for factor in factors:
+            for variable in factor.variables:
+                neighbors[variable].update(factor.variables)
+        for name in neighbors:
+            neighbors[name].discard(name)
+
+        candidates = []
+        for variable in min_fill_order(factors, list(network.nodes)):
+            adjacent = neighbors.pop(variable)
+            candidates.append(frozenset(adjacent | {variable}))
+            for a in adjacent:
+                neighbors[a].discard(variable)
+                neighbors[a].update(adjacent - {a})
+
+        # Keep only maximal cliques
+        for clique in candidates:
+            if not any(clique < other for other in candidates) and clique not in self.cliques:
+                self.cliques.append(clique)
+
+        # Maximum-weight spanning tree over separator sizes (Kruskal)
+        self.neighbors = [set() for _ in self.cliques]
+        component = list(range(len(self.cliques)))
+
+        def find(i):
+            while component[i] != i:
+                component[i] = component[component[i]]
+                i = component[i]
+            return i
+
+        edges = sorted(
+            (
+                (len(a & b), i, j)
+                for i, a in enumerate(self.cliques)
+                for j, b in enumerate(self.cliques)
+                if i < j
+            ),
+            reverse=True
+        )
+        for _, i, j in edges:
+            if find(i) != find(j):
+                component[find(i)] = find(j)
+                self.neighbors[i].add(j)
+                self.neighbors[j].add(i)
+
+        # Each CPT goes to one clique containing its whole family
+        self.potentials = [
+            Factor(sorted(clique), np.ones([len(network.nodes[v].values) for v in sorted(clique)]))
+            for clique in self.cliques
+        ]
+        for factor in factors:
+            for i, clique in enumerate(self.cliques):
+                if clique.issuperset(factor.variables):
+                    self.potentials[i] = self.potentials[i].multiply(factor)
+                    break
+
+        # Each variable is read from (and observed in) its smallest clique
+        for name in network.nodes:
+            self.home[name] = min(
+                (i for i, clique in enumerate(self.cliques) if name in clique),
+                key=lambda i: len(self.cliques[i])
+            )
+
+        # For each directed edge i -> j, the cliques on i's side of it
+        self.upstream = {}
+        for i in range(len(self.cliques)):
+            for j in self.neighbors[i]:
+                side = set()
+                stack = [i]
+                while stack:
+                    k = stack.pop()
+                    side.add(k)
+                    stack.extend(n for n in self.neighbors[k] if n not in side and n != j)
+                self.upstream[(i, j)] = side
+
+    def local(self, i):
+        """Return clique i's potential with its observed evidence applied."""
+        factor = self.potentials[i]
+        for name, value in self.evidence.items():
+            if self.home[name] == i:
+                indicator = np.zeros(len(self.network.nodes[name].values))
+                indicator[value] = 1
+                factor = factor.multiply(Factor([name], indicator))
+        return factor
+
+    def message(self, i, j):
+        """Return the (cached) message from clique i to neighbor j."""
+        if (i, j) not in self.messages:
+            factor = product([self.local(i)] + [self.message(k, i) for k in self.neighbors[i] if k != j])
+            for variable in factor.variables:
+                if variable not in self.cliques[j]:
+                    factor = factor.sum_out(variable)
+
+            # Rescale so long chains of messages don't underflow
+            factor.table = factor.table / factor.table.sum()
+            self.messages[(i, j)] = factor
+        return self.messages[(i, j)]
+
+    def calibrate(self):
+        """Compute every message in both directions."""
+        for i in range(len(self.cliques)):
+            for j in self.neighbors[i]:
+                self.message(i, j)
+
+    def set_evidence(self, evidence):
+        """Apply {name: value} evidence, invalidating only affected messages."""
+        codes = self.network.encode_evidence(evidence)
+        changed = {
+            self.home[name]
+            for name in set(codes) | set(self.evidence)
+            if codes.get(name) != self.evidence.get(name)
+        }
+        self.evidence = codes
+        for edge in list(self.messages):
+            if self.upstream[edge] & changed:
+                del self.messages[edge]
+
+    def belief(self, i):
+        """Return the normalized joint over clique i's variables."""
+        factor = product([self.local(i)] + [self.message(k, i) for k in self.neighbors[i]])
+        factor.table = factor.table / factor.table.sum()
+        return factor
+
+    def marginal(self, name):
+        """Return the posterior over one node's values under the current evidence."""
+        factor = self.belief(self.home[name])
+        for variable in factor.variables:
+            if variable != name:
+                factor = factor.sum_out(variable)
+        return factor.table
+
+    def predict_proba(self, evidence=None):
+        """
+        Return posteriors for every node given evidence like {"train": "delayed"},
+        in the same format as BayesianNetwork.predict_proba.
+        """
+        evidence = evidence or {}
+        key = frozenset(evidence.items())
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return {name: dict(p) if isinstance(p, dict) else p for name, p in self.cache[key].items()}
+
+        self.set_evidence(evidence)
+        predictions = {}
+        for name, node in self.network.nodes.items():
+            if name in evidence:
+                predictions[name] = evidence[name]
+            else:
+                predictions[name] = dict(zip(node.values, self.marginal(name).tolist()))
+
+        self.cache[key] = predictions
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return {name: dict(p) if isinstance(p, dict) else p for name, p in predictions.items()}
+
+
+if __name__ == "__main__":
+    import time
+
+    from network import model
+
+    tree = JunctionTree(model)
+    tree.calibrate()
+    print("Cliques:", [sorted(clique) for clique in tree.cliques])
+
+    for node, prediction in tree.predict_proba({"train": "delayed"}).items():
+        if isinstance(prediction, str):
+            print(f"{node}: {prediction}")
+        else:
+            print(f"{node}:")
+            for value, probability in prediction.items():
+                print(f"  {value}: {probability:.4f}")
+
+    queries = [{"train": t, "rain": r} for t in ("ontime", "delayed") for r in ("none", "light", "heavy")]
+    start = time.perf_counter()
+    for _ in range(1000):
+        for query in queries:
+            tree.predict_proba(query)
+    elapsed = time.perf_counter() - start
+    print(f"{1000 * len(queries) / elapsed:.0f} queries per second")
@@ -1,6 +1,16 @@
-from model import model
+from network import model
 
 # Calculate probability for a given observation
 probability = model.probability([["none","no","ontime","attend"]])
 
-print(probability)
\ No newline at end of file
+print(probability)
+
+# Many logged rows at once: encode the strings once, then score every row
+# in log space with a single pass over the CPTs
+rows = [
+    ["none", "no", "ontime", "attend"],
+    ["light", "yes", "delayed", "miss"],
+    ["heavy", "no", "delayed", "attend"],
+]
+codes = model.encode(rows)
+print(model.log_probability(codes))
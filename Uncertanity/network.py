@@ -0,0 +1,6 @@
+import os
+
+from bayesnet import load
+
+# Same network as model.py, without pomegranate, loaded from network.json
+model = load(os.path.join(os.path.dirname(os.path.abspath(__file__)), "network.json"))
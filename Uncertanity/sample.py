@@ -1,7 +1,15 @@
-import pomegranate
+import argparse
 
 from collections import Counter
-from model import model
+
+# pomegranate is only imported when asked for: python sample.py --backend pomegranate
+parser = argparse.ArgumentParser()
+parser.add_argument("--backend", choices=["native", "pomegranate"], default="native")
+POMEGRANATE = parser.parse_args().backend == "pomegranate"
+
+if POMEGRANATE:
+     import pomegranate
+     from model import model
 
 def generate_sample():
      # Mapping of random variable name to sample generated
@@ -30,12 +38,17 @@ def generate_sample():
 #Rejection sampling
 #Compute distribution of Appointment given that train is delayed
 N = 10000
-data = []
-for _ in range(N):
-     sample = generate_sample()
-     if sample["train"] == "delayed":
-          data.append(sample["appointment"])
+if POMEGRANATE:
+     data = []
+     for _ in range(N):
+          sample = generate_sample()
+          if sample["train"] == "delayed":
+               data.append(sample["appointment"])
+else:
+     from network import model
+     from sampling import rejection_sample
+
+     samples = rejection_sample(model, N, {"train": "delayed"})
+     values = model.nodes["appointment"].values
+     data = [values[code] for code in samples["appointment"]]
 print (Counter(data))          
-
-          
-